@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+############################################################################
+#                                                                          #
+#  PyTCP - Python TCP/IP stack                                             #
+#  Copyright (C) 2020-present Sebastian Majewski                           #
+#                                                                          #
+#  This program is free software: you can redistribute it and/or modify    #
+#  it under the terms of the GNU General Public License as published by    #
+#  the Free Software Foundation, either version 3 of the License, or       #
+#  (at your option) any later version.                                     #
+#                                                                          #
+#  This program is distributed in the hope that it will be useful,         #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of          #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           #
+#  GNU General Public License for more details.                            #
+#                                                                          #
+#  You should have received a copy of the GNU General Public License       #
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.  #
+#                                                                          #
+#  Author's email: ccie18643@gmail.com                                     #
+#  Github repository: https://github.com/ccie18643/PyTCP                   #
+#                                                                          #
+############################################################################
+
+
+"""
+Queue based logger used by the example services to keep per-message
+console output off the service threads.
+
+examples/lib/service_log.py
+
+ver 2.7
+"""
+
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+service_log = logging.getLogger("examples.service")
+service_log.setLevel(logging.INFO)
+service_log.propagate = False
+service_log.addHandler(logging.handlers.QueueHandler(_log_queue))
+
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout)
+)
+_log_listener.start()
+
+# Flush the queued messages on exit, the listener thread is a daemon and
+# would otherwise drop them
+atexit.register(_log_listener.stop)
@@ -140,6 +140,27 @@ class TcpService:
 
         self.service(connected_socket=connected_socket)
 
+    @staticmethod
+    def recv_exact(*, connected_socket: Socket, byte_count: int) -> bytes:
+        """
+        Receive exactly 'byte_count' bytes from the connected socket.
+        Chunks are collected in a list and joined once to avoid
+        re-copying the already received data on every 'recv()' call.
+        """
+
+        chunks: list[bytes] = []
+        received = 0
+
+        while received < byte_count:
+            if not (chunk := connected_socket.recv(byte_count - received)):
+                raise EOFError(
+                    f"Connection closed after {received} of {byte_count} bytes."
+                )
+            chunks.append(chunk)
+            received += len(chunk)
+
+        return b"".join(chunks)
+
     def service(self, *, connected_socket: Socket) -> None:
         """
         Service method.
@@ -41,6 +41,7 @@ from typing import TYPE_CHECKING
 
 import click
 
+from examples.lib.service_log import service_log
 from examples.lib.tcp_service import TcpService
 from pytcp import TcpIpStack, initialize_tap
 
@@ -79,8 +80,9 @@ class TcpDaytimeService(TcpService):
         Inbound connection handler.
         """
 
-        # Create local copy of this variable.
+        # Create local copies of the loop invariants.
         message_count = self._message_count
+        now = datetime.now
 
         click.echo(
             "Service TCP Daytime: Sending first message to "
@@ -89,7 +91,7 @@ class TcpDaytimeService(TcpService):
         connected_socket.send(b"***CLIENT OPEN / SERVICE OPEN***\n")
 
         while self._run_thread and message_count:
-            message = bytes(str(datetime.now()) + "\n", "utf-8")
+            message = now().isoformat(" ").encode() + b"\n"
 
             try:
                 connected_socket.send(message)
@@ -97,12 +99,14 @@ class TcpDaytimeService(TcpService):
                 click.echo(f"Service TCP Daytime: send() error - {error!r}.")
                 break
 
-            click.echo(
-                f"Service TCP Daytime: Sent {len(message)} bytes of data "
-                f"to {connected_socket.remote_ip_address}, port {connected_socket.remote_port}."
+            service_log.info(
+                "Service TCP Daytime: Sent %d bytes of data to %s, port %d.",
+                len(message),
+                connected_socket.remote_ip_address,
+                connected_socket.remote_port,
             )
             time.sleep(self._message_delay)
-            message_count = min(message_count, message_count - 1)
+            message_count -= 1
 
         connected_socket.close()
         click.echo(
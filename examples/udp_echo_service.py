@@ -41,6 +41,7 @@ from typing import TYPE_CHECKING
 import click
 
 from examples.lib.malpi import malpa, malpi, malpka
+from examples.lib.service_log import service_log
 from examples.lib.udp_service import UdpService
 from pytcp import TcpIpStack, initialize_tap
 
@@ -72,26 +73,33 @@ class UdpEchoService(UdpService):
         """
 
         while self._run_thread:
-            message, remote_address = listening_socket.recvfrom()
-
-            click.echo(
-                f"Service UDP Echo: Received {len(message)} bytes from "
-                f"{remote_address[0]}, port {remote_address[1]}."
-            )
-
-            if b"malpka" in message.strip().lower():
-                message = malpka
-            elif b"malpa" in message.strip().lower():
-                message = malpa
-            elif b"malpi" in message.strip().lower():
-                message = malpi
-
-            listening_socket.sendto(message, remote_address)
-
-            click.echo(
-                f"Service UDP Echo: Echo'ed {len(message)} bytes back to "
-                f"{remote_address[0]}, port {remote_address[1]}."
-            )
+            for message, remote_address in listening_socket.recvfrom_batch(
+                max_count=64
+            ):
+                service_log.info(
+                    "Service UDP Echo: Received %d bytes from %s, port %d.",
+                    len(message),
+                    remote_address[0],
+                    remote_address[1],
+                )
+
+                keyword = message.strip().lower()
+
+                if b"malpka" in keyword:
+                    message = malpka
+                elif b"malpa" in keyword:
+                    message = malpa
+                elif b"malpi" in keyword:
+                    message = malpi
+
+                listening_socket.sendto(message, remote_address)
+
+                service_log.info(
+                    "Service UDP Echo: Echo'ed %d bytes back to %s, port %d.",
+                    len(message),
+                    remote_address[0],
+                    remote_address[1],
+                )
 
 
 @click.command()
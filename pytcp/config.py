@@ -89,6 +89,14 @@ PACKET_INTEGRITY_CHECK = True
 # integrity.
 PACKET_SANITY_CHECK = True
 
+# Packet checksum check, if enabled the IPv4, ICMPv4, ICMPv6, UDP and TCP
+# parsers verify checksum of every received packet as part of the integrity
+# check. It should be disabled only when the interface stack is bound to is
+# trusted to deliver packets with already verified checksums (eg. checksum
+# offload on the NIC side or local virtual link), as it then saves a full
+# pass over each packet.
+PACKET_CHECKSUM_CHECK = True
+
 # Drop IPv4 packets containing options - this seems to be widely adopted
 # security feature. Stack parses but doesn't support IPv4 options as they are
 # mostly useless anyway.
@@ -111,11 +119,21 @@ IP6_DEFAULT_HOP = 64
 IP4_DEFAULT_TTL = 64
 
 # IPv4 and IPv6 fragmnt flow expiration time, determines for how many seconds
-# fragment flow is considered valid. Fragemnt flows are being cleaned up prior
-# of handling every fragmented packet.
+# fragment flow is considered valid. Expired fragment flows are swept at most
+# once per second.
 IP4_FRAG_FLOW_TIMEOUT = 5
 IP6_FRAG_FLOW_TIMEOUT = 5
 
+# IPv4 and IPv6 fragment flow limit, when reached the least recently used flow
+# is dropped to make room for the new one.
+IP4_FRAG_FLOW_LIMIT = 512
+IP6_FRAG_FLOW_LIMIT = 512
+
+# IPv4 and IPv6 limit of out of order fragments held per flow, flow that
+# exceeds it gets dropped.
+IP4_FRAG_FLOW_FRAG_LIMIT = 128
+IP6_FRAG_FLOW_FRAG_LIMIT = 128
+
 # IPv4 DHCP based address configuration
 IP4_HOST_DHCP = True
 
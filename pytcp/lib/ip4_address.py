@@ -58,6 +58,9 @@ IP4_REGEX = (
     r"(25[0-5]|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])"
 )
 
+IP4_PATTERN = re.compile(IP4_REGEX)
+IP4_STRUCT = struct.Struct("!L")
+
 
 class Ip4AddressFormatError(IpAddressFormatError):
     ...
@@ -101,14 +104,14 @@ class Ip4Address(IpAddress):
 
         if isinstance(address, (memoryview, bytes, bytearray)):
             if len(address) == 4:
-                self._address = struct.unpack("!L", address)[0]
+                self._address = IP4_STRUCT.unpack(address)[0]
                 return
 
         if isinstance(address, str):
-            if re.search(IP4_REGEX, address):
+            if IP4_PATTERN.search(address):
                 try:
-                    self._address = struct.unpack(
-                        "!L", socket.inet_aton(address)
+                    self._address = IP4_STRUCT.unpack(
+                        socket.inet_aton(address)
                     )[0]
                     return
                 except OSError:
@@ -130,7 +133,7 @@ class Ip4Address(IpAddress):
         """
         The '__bytes__()' dunder.
         """
-        return struct.pack("!L", self._address)
+        return IP4_STRUCT.pack(self._address)
 
     @property
     def is_global(self) -> bool:
@@ -231,9 +234,7 @@ class Ip4Address(IpAddress):
         Create IPv6 multicast MAC address.
         """
         assert self.is_multicast
-        return MacAddress(
-            int(MacAddress(0x01005E000000)) | self._address & 0x7FFFFF
-        )
+        return MacAddress(0x01005E000000 | self._address & 0x7FFFFF)
 
 
 class Ip4Mask(IpMask):
@@ -255,11 +256,8 @@ class Ip4Mask(IpMask):
             """
             Validate that mask is made of consecutive bits.
             """
-            bit_mask = f"{self._mask:032b}"
-            try:
-                return not bit_mask[bit_mask.index("0") :].count("1")
-            except ValueError:
-                return True
+            host_bits = ~self._mask & 0xFF_FF_FF_FF
+            return not host_bits & (host_bits + 1)
 
         if isinstance(mask, int):
             if mask & 0xFF_FF_FF_FF == mask:
@@ -269,19 +267,20 @@ class Ip4Mask(IpMask):
 
         if isinstance(mask, (memoryview, bytes, bytearray)):
             if len(mask) == 4:
-                self._mask = struct.unpack("!L", mask)[0]
+                self._mask = IP4_STRUCT.unpack(mask)[0]
                 if _validate_bits():
                     return
 
-        if isinstance(mask, str) and re.search(r"^\/\d{1,2}$", mask):
-            bit_count = int(mask[1:])
-            if bit_count in range(33):
-                self._mask = int("1" * bit_count + "0" * (32 - bit_count), 2)
-                return
+        if isinstance(mask, str) and mask[:1] == "/":
+            if 1 < len(mask) <= 3 and mask[1:].isdecimal():
+                bit_count = int(mask[1:])
+                if bit_count <= 32:
+                    self._mask = ~(0xFF_FF_FF_FF >> bit_count) & 0xFF_FF_FF_FF
+                    return
 
-        if isinstance(mask, str) and re.search(IP4_REGEX, mask):
+        elif isinstance(mask, str) and IP4_PATTERN.search(mask):
             try:
-                self._mask = struct.unpack("!L", socket.inet_aton(mask))[0]
+                self._mask = IP4_STRUCT.unpack(socket.inet_aton(mask))[0]
                 if _validate_bits():
                     return
             except OSError:
@@ -297,7 +296,7 @@ class Ip4Mask(IpMask):
         """
         The '__bytes_()' dunder.
         """
-        return struct.pack("!L", self._mask)
+        return IP4_STRUCT.pack(self._mask)
 
 
 class Ip4Network(IpNetwork):
@@ -382,6 +381,8 @@ class Ip4Host(IpHost):
     IPv4 host support class.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         host: Ip4Host
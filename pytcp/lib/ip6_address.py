@@ -210,8 +210,8 @@ class Ip6Address(IpAddress):
         Create IPv6 solicited node multicast address.
         """
         return Ip6Address(
-            self._address & 0xFFFFFF | int(Ip6Address("ff02::1:ff00:0"))
-        )
+            self._address & 0xFFFFFF | 0xFF02_0000_0000_0000_0000_0001_FF00_0000
+        )  # ff02::1:ff00:0/104
 
     @property
     def multicast_mac(self) -> MacAddress:
@@ -219,9 +219,7 @@ class Ip6Address(IpAddress):
         Create IPv6 multicast MAC address.
         """
         assert self.is_multicast
-        return MacAddress(
-            int(MacAddress(0x333300000000)) | self._address & 0xFFFFFFFF
-        )
+        return MacAddress(0x333300000000 | self._address & 0xFFFFFFFF)
 
     @property
     def unspecified(self) -> Ip6Address:
@@ -250,11 +248,8 @@ class Ip6Mask(IpMask):
             """
             Validate that mask is made of consecutive bits.
             """
-            bit_mask = f"{self._mask:0128b}"
-            try:
-                return not bit_mask[bit_mask.index("0") :].count("1")
-            except ValueError:
-                return True
+            host_bits = ~self._mask & 0xFFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF
+            return not host_bits & (host_bits + 1)
 
         if isinstance(mask, int):
             if mask & 0xFFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF == mask:
@@ -368,14 +363,11 @@ class Ip6Network(IpNetwork):
         Create IPv6 EUI64 interface address.
         """
         assert len(self.mask) == 64
+        mac = int(mac_address)
         interface_id = (
-            ((int(mac_address) & 0xFFFFFF000000) << 16)
-            | int(mac_address) & 0xFFFFFF
-            | 0xFFFE000000
+            ((mac & 0xFFFFFF000000) << 16) | mac & 0xFFFFFF | 0xFFFE000000
         ) ^ 0x0200000000000000
-        return Ip6Host(
-            (Ip6Address(int(self._address) | interface_id), Ip6Mask("/64"))
-        )
+        return Ip6Host((Ip6Address(int(self._address) | interface_id), self))
 
 
 class Ip6Host(IpHost):
@@ -383,6 +375,8 @@ class Ip6Host(IpHost):
     IPv6 host support class.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         host: Ip6Host
@@ -416,9 +410,11 @@ class Ip6Host(IpHost):
 
         if isinstance(host, str):
             try:
-                address, _ = host.split("/")
+                address, mask = host.split("/")
                 self._address = Ip6Address(address)
-                self._network = Ip6Network(host)
+                self._network = Ip6Network(
+                    (self._address, Ip6Mask("/" + mask))
+                )
                 return
             except (ValueError, Ip6AddressFormatError, Ip6MaskFormatError):
                 pass
@@ -460,7 +456,11 @@ class Ip6Host(IpHost):
         Setter for the '_gateway' attribute.
         """
 
-        if address is not None and address not in Ip6Network("fe80::/10"):
+        if address is not None and not address.is_link_local:
             raise Ip6HostGatewayError(address)
 
         self._gateway = address
+
+
+IP6_ALL_NODES = Ip6Address("ff02::1")
+IP6_ALL_ROUTERS = Ip6Address("ff02::2")
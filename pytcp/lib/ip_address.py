@@ -78,9 +78,16 @@ class IpAddress(ABC):
 
     def __eq__(self, other: object) -> bool:
         """
-        The '__eq__()' dunder.
-        """
-        return repr(self) == repr(other)
+        The '__eq__()' dunder. Same class check goes first as it
+        avoids the slower ABC instance check in the common case.
+        """
+        if other.__class__ is self.__class__:
+            return self._address == other._address  # type: ignore[attr-defined]
+        return (
+            isinstance(other, IpAddress)
+            and self._version == other._version
+            and self._address == other._address
+        )
 
     def __repr__(self) -> str:
         """
@@ -264,9 +271,16 @@ class IpMask(ABC):
 
     def __eq__(self, other: object) -> bool:
         """
-        The '__eq__()' dunder.
+        The '__eq__()' dunder. Same class check goes first as it
+        avoids the slower ABC instance check in the common case.
         """
-        return repr(self) == repr(other)
+        if other.__class__ is self.__class__:
+            return self._mask == other._mask  # type: ignore[attr-defined]
+        return (
+            isinstance(other, IpMask)
+            and self._version == other._version
+            and self._mask == other._mask
+        )
 
     def __hash__(self) -> int:
         """
@@ -278,7 +292,7 @@ class IpMask(ABC):
         """
         The '__len__()' dunder that returns the bit length of mask.
         """
-        return f"{self._mask:b}".count("1")
+        return self._mask.bit_count()
 
     @property
     def version(self) -> int:
@@ -338,7 +352,12 @@ class IpNetwork(ABC):
         """
         The '__eq__()' dunder.
         """
-        return repr(self) == repr(other)
+        return (
+            isinstance(other, IpNetwork)
+            and self._version == other._version
+            and self._address == other._address
+            and self._mask == other._mask
+        )
 
     def __hash__(self) -> int:
         """
@@ -350,19 +369,13 @@ class IpNetwork(ABC):
         """
         The '__contains__()' dunder for the 'in' operator.
         """
-        if isinstance(other, IpAddress):
-            return (
-                isinstance(other, IpAddress)
-                and self._version == other.version
-                and int(self.address) <= int(other) <= int(self.last)
-            )
         if isinstance(other, IpHost):
-            return (
-                isinstance(other, IpHost)
-                and self._version == other.version
-                and int(self.address) <= int(other.address) <= int(self.last)
-            )
-        return False
+            other = other._address
+        return (
+            isinstance(other, IpAddress)
+            and self._version == other._version
+            and other._address & self._mask._mask == self._address._address
+        )
 
     @property
     def version(self) -> int:
@@ -427,6 +440,8 @@ class IpHost(ABC):
     IP host support base class.
     """
 
+    __slots__ = ("_address", "_network", "_version", "_gateway", "_hash")
+
     @abstractmethod
     def __init__(self) -> None:
         """
@@ -453,13 +468,23 @@ class IpHost(ABC):
         """
         The '__eq__()' dunder.
         """
-        return repr(self) == repr(other)
+        return (
+            isinstance(other, IpHost)
+            and self._version == other._version
+            and self._address == other._address
+            and self._network == other._network
+        )
 
     def __hash__(self) -> int:
         """
-        The '__hash__()' dunder.
+        The '__hash__()' dunder. The address and network never change after
+        the host is created, so the hash is computed on first use only.
         """
-        return hash(self._address) ^ hash(self._network)
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(self._address) ^ hash(self._network)
+            return self._hash
 
     @property
     def version(self) -> int:
@@ -35,8 +35,7 @@ ver 2.7
 
 from __future__ import annotations
 
-import struct
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from pytcp.lib import stack
 from pytcp.lib.ip4_address import Ip4Address, Ip4AddressFormatError
@@ -50,44 +49,53 @@ def inet_cksum(data: memoryview, init: int = 0) -> int:
     """
     Compute Internet Checksum used by IPv4/ICMPv4/ICMPv6/UDP/TCP protocols.
     """
-    if (dlen := len(data)) == 20:
-        cksum = init + int(sum(struct.unpack("!5L", data)))
-    else:
-        cksum = init + int(sum(struct.unpack_from(f"!{dlen >> 3}Q", data)))
-        if remainder := dlen & 7:
-            cksum += int().from_bytes(data[-remainder:], byteorder="big") << (
-                (8 - remainder) << 3
-            )
-        cksum = (cksum >> 64) + (cksum & 0xFFFFFFFFFFFFFFFF)
-    cksum = (cksum >> 32) + (cksum & 0xFFFFFFFF)
-    cksum = (cksum >> 16) + (cksum & 0xFFFF)
-    return ~(cksum + (cksum >> 16)) & 0xFFFF
+    # The one's complement sum of 16-bit words is congruent to the value of
+    # the whole buffer, read as a single big-endian integer, modulo 0xFFFF
+    # (as 2**16 is congruent to 1). This lets the summing run entirely in C
+    # over the buffer, odd length buffer gets padded with a trailing zero.
+    # The padding shift and the 'init' addition are applied after the first
+    # reduction so they operate on a small integer instead of copying the
+    # whole buffer sized one.
+    if not (cksum := int.from_bytes(data)) and not init:
+        return 0xFFFF
+    cksum = (cksum % 0xFFFF << ((len(data) & 1) << 3)) + init
+    return 0xFFFF - ((cksum - 1) % 0xFFFF + 1)
+
+
+def inet_cksum_incr(cksum: int, old_word: int, new_word: int) -> int:
+    """
+    Update Internet Checksum after single 16-bit word of the checksummed
+    data changed from 'old_word' to 'new_word' (RFC 1624, eqn. 3).
+    The result may be 0x0000 where 'inet_cksum()' over the updated data
+    gives 0xFFFF, both are the one's complement zero and verify the same.
+    """
+    cksum = (~cksum & 0xFFFF) + (~old_word & 0xFFFF) + new_word
+    cksum = (cksum & 0xFFFF) + (cksum >> 16)
+    cksum = (cksum & 0xFFFF) + (cksum >> 16)
+    return ~cksum & 0xFFFF
 
 
 def ip_version(ip_address: str) -> int | None:
     """
     Return version of IP address string.
     """
-    try:
-        return Ip6Address(ip_address).version
-    except Ip6AddressFormatError:
-        try:
-            return Ip4Address(ip_address).version
-        except Ip4AddressFormatError:
-            return None
+    if (ip := str_to_ip(ip_address)) is not None:
+        return ip.version
+    return None
 
 
 def str_to_ip(ip_address: str) -> Ip6Address | Ip4Address | None:
     """
     Convert string to appropriate version IP address.
     """
+    # Only the IPv6 address notation uses colons, so there is no need to
+    # attempt (and fail) IPv6 parsing of an IPv4 address string.
     try:
-        return Ip6Address(ip_address)
-    except Ip6AddressFormatError:
-        try:
-            return Ip4Address(ip_address)
-        except Ip4AddressFormatError:
-            return None
+        if ":" in ip_address:
+            return Ip6Address(ip_address)
+        return Ip4Address(ip_address)
+    except (Ip6AddressFormatError, Ip4AddressFormatError):
+        return None
 
 
 def pick_local_ip_address(
@@ -98,9 +106,9 @@ def pick_local_ip_address(
     destination IP address.
     """
     assert isinstance(remote_ip_address, (Ip6Address, Ip4Address))
-    if isinstance(remote_ip_address, Ip6Address):
-        return pick_local_ip6_address(remote_ip_address)
-    return pick_local_ip4_address(remote_ip_address)
+    if remote_ip_address.is_ip6:
+        return pick_local_ip6_address(cast(Ip6Address, remote_ip_address))
+    return pick_local_ip4_address(cast(Ip4Address, remote_ip_address))
 
 
 def pick_local_ip6_address(remote_ip6_address: Ip6Address) -> Ip6Address:
@@ -66,6 +66,15 @@ STYLES = {
 START_TIME = time.time()
 
 
+def log_enabled(channel: str) -> bool:
+    """
+    Check if channel is configured to log, lets hot paths skip building
+    the log message altogether.
+    """
+
+    return channel in config.LOG_CHANEL
+
+
 def log(channel: str, message: str, inspect_depth: int = 1) -> bool:
     """
     Log message if channel and severity match configured values.
@@ -36,8 +36,15 @@ ver 2.7
 
 from __future__ import annotations
 
-import re
-import struct
+MAC_SEPARATORS = str.maketrans("", "", ":-.")
+MAC_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+MAC_FLAG_UNSPECIFIED = 1 << 0
+MAC_FLAG_UNICAST = 1 << 1
+MAC_FLAG_MULTICAST_IP4 = 1 << 2
+MAC_FLAG_MULTICAST_IP6 = 1 << 3
+MAC_FLAG_MULTICAST_IP6_SOLICITED_NODE = 1 << 4
+MAC_FLAG_BROADCAST = 1 << 5
 
 
 class MacIp4AddressFormatError(Exception):
@@ -49,6 +56,8 @@ class MacAddress:
     Ethernet MAC address support class.
     """
 
+    __slots__ = ("_address", "_str", "_bytes")
+
     def __init__(
         self, address: MacAddress | str | bytes | bytearray | memoryview | int
     ) -> None:
@@ -56,28 +65,42 @@ class MacAddress:
         Class constructor.
         """
 
-        if isinstance(address, int):
-            if address in range(281474976710656):
-                self._address = address
-                return
+        # The address never changes after construction, so its string and
+        # bytes representations are computed on first use and then reused.
+        self._address: int
+        self._str: str | None = None
+        self._bytes: bytes | None = None
 
+        # Frame parsers hand in memoryview slices, so that case is checked
+        # first to keep the common RX path to a single type test.
         if isinstance(address, (memoryview, bytes, bytearray)):
             if len(address) == 6:
-                v_1, v_2, v_3 = struct.unpack("!HHH", address)
-                self._address = (v_1 << 32) + (v_2 << 16) + v_3
+                self._address = int.from_bytes(address)
+                return
+
+        if isinstance(address, int):
+            if address in range(281474976710656):
+                self._address = address
                 return
 
         if isinstance(address, str):
-            if re.search(
-                r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$", address.strip()
-            ):
-                v_1, v_2, v_3 = struct.unpack(
-                    "!HHH",
-                    bytes.fromhex(
-                        re.sub(r":|-|\.", "", address.lower().strip())
-                    ),
+            mac = address.strip()
+
+            # Accepts the 'xx:xx:xx:xx:xx:xx' / 'xx-xx-xx-xx-xx-xx', the
+            # 'xxxx.xxxx.xxxx' and the bare 'xxxxxxxxxxxx' forms. Separators
+            # are validated by position and digits by a hex digit set lookup.
+            if (
+                (
+                    len(mac) == 17
+                    and not mac[2::3].strip(":-")
+                    or len(mac) == 14
+                    and mac[4::5] == ".."
+                    or len(mac) == 12
                 )
-                self._address = (v_1 << 32) + (v_2 << 16) + v_3
+                and len(digits := mac.translate(MAC_SEPARATORS)) == 12
+                and MAC_HEX_DIGITS.issuperset(digits)
+            ):
+                self._address = int(digits, 16)
                 return
 
         if isinstance(address, MacAddress):
@@ -90,7 +113,9 @@ class MacAddress:
         """
         The '__str__()' dunder.
         """
-        return ":".join([f"{_:0>2x}" for _ in bytes(self)])
+        if self._str is None:
+            self._str = bytes(self).hex(":")
+        return self._str
 
     def __repr__(self) -> str:
         """
@@ -102,12 +127,9 @@ class MacAddress:
         """
         The '__bytes__() dunder.
         """
-        return struct.pack(
-            "!HHH",
-            (self._address >> 32) & 0xFFFF,
-            (self._address >> 16) & 0xFFFF,
-            self._address & 0xFFFF,
-        )
+        if self._bytes is None:
+            self._bytes = self._address.to_bytes(6)
+        return self._bytes
 
     def __int__(self) -> int:
         """
@@ -119,7 +141,9 @@ class MacAddress:
         """
         The '__eq__()' dunder.
         """
-        return repr(self) == repr(other)
+        return (
+            isinstance(other, MacAddress) and self._address == other._address
+        )
 
     def __hash__(self) -> int:
         """
@@ -175,3 +199,34 @@ class MacAddress:
         Check if address is a broadcast MAC.
         """
         return self._address == 281474976710655
+
+    def classify(self) -> int:
+        """
+        Classify address in a single pass, returns the 'MAC_FLAG_*' bits
+        matching the 'is_*' properties.
+        """
+
+        address = self._address
+
+        if address == 0:
+            return MAC_FLAG_UNSPECIFIED
+
+        if address == 0xFFFFFFFFFFFF:
+            return MAC_FLAG_BROADCAST
+
+        if address >> 24 == 0x01005E:
+            return MAC_FLAG_MULTICAST_IP4
+
+        if address >> 32 == 0x3333:
+            if address >> 24 == 0x3333FF:
+                return (
+                    MAC_FLAG_MULTICAST_IP6
+                    | MAC_FLAG_MULTICAST_IP6_SOLICITED_NODE
+                )
+            return MAC_FLAG_MULTICAST_IP6
+
+        return MAC_FLAG_UNICAST
+
+
+MAC_ZERO = MacAddress(0)
+MAC_BROADCAST = MacAddress(0xFFFFFFFFFFFF)
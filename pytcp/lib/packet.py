@@ -60,7 +60,7 @@ class PacketRx:
     Base packet RX class.
     """
 
-    def __init__(self, frame: bytes) -> None:
+    def __init__(self, frame: bytes | bytearray) -> None:
         """
         Class constructor.
         """
@@ -51,12 +51,14 @@ from pytcp.lib import stack
 from pytcp.lib.ip4_address import Ip4Address, Ip4AddressFormatError
 from pytcp.lib.ip6_address import Ip6Address, Ip6AddressFormatError
 from pytcp.lib.ip_helper import pick_local_ip_address
+from pytcp.lib.socket_type import SOCK_DGRAM, SOCK_STREAM, SocketType
 from pytcp.protocols.tcp.metadata import TcpMetadata
 from pytcp.protocols.tcp.session import FsmState, TcpSession
 from pytcp.protocols.udp.metadata import UdpMetadata
 
 if TYPE_CHECKING:
     from threading import Semaphore
+    from typing import Callable
 
     from pytcp.lib.ip_address import IpAddress
 
@@ -91,21 +93,9 @@ AF_INET4 = AddressFamily.AF_INET4
 AF_INET6 = AddressFamily.AF_INET6
 
 
-class SocketType(IntEnum):
-    """
-    Socket type identifier enum.
-    """
-
-    SOCK_UNSPECIFIED = 0
-    SOCK_STREAM = 1
-    SOCK_DGRAM = 2
-
-    def __str__(self) -> str:
-        return str(self.name)
-
-
-SOCK_STREAM = SocketType.SOCK_STREAM
-SOCK_DGRAM = SocketType.SOCK_DGRAM
+# Socket classes are filled in on the first 'socket()' call as their modules
+# import this one
+SOCKET_CLASSES: dict[SocketType, Callable[[AddressFamily], Socket]] = {}
 
 
 def socket(
@@ -117,13 +107,13 @@ def socket(
 
     assert type is SOCK_STREAM or type is SOCK_DGRAM
 
-    from pytcp.protocols.tcp.socket import TcpSocket
-    from pytcp.protocols.udp.socket import UdpSocket
+    if type not in SOCKET_CLASSES:
+        from pytcp.protocols.tcp.socket import TcpSocket
+        from pytcp.protocols.udp.socket import UdpSocket
 
-    if type is SOCK_DGRAM:
-        return UdpSocket(family)
+        SOCKET_CLASSES.update({SOCK_STREAM: TcpSocket, SOCK_DGRAM: UdpSocket})
 
-    return TcpSocket(family)
+    return SOCKET_CLASSES[type](family)
 
 
 class Socket(ABC):
@@ -158,6 +148,19 @@ class Socket(ABC):
             f"{self._local_port}/{self._remote_ip_address}/{self._remote_port}"
         )
 
+    @property
+    def socket_id(self) -> tuple[SocketType, IpAddress, int, IpAddress, int]:
+        """
+        Socket ID used as the key in the stack socket table.
+        """
+        return (
+            self._type,
+            self._local_ip_address,
+            self._local_port,
+            self._remote_ip_address,
+            self._remote_port,
+        )
+
     @property
     def family(self) -> AddressFamily:
         """
@@ -206,7 +209,7 @@ class Socket(ABC):
         by any socket.
         """
         available_ephemeral_ports = set(config.EPHEMERAL_PORT_RANGE) - {
-            int(_.split("/")[3]) for _ in stack.sockets
+            _[2] for _ in stack.sockets
         }
         if len(available_ephemeral_ports):
             return available_ephemeral_ports.pop()
@@ -345,6 +348,14 @@ class Socket(ABC):
             """
             raise NotImplementedError
 
+        def recvfrom_batch(
+            self, max_count: int, timeout: float | None = None
+        ) -> list[tuple[bytes, tuple[str, int]]]:
+            """
+            The 'recvfrom_batch()' socket API placeholder.
+            """
+            raise NotImplementedError
+
         def process_udp_packet(self, packet_rx_md: UdpMetadata) -> None:
             """
             The 'process_udp_packet()' method plceholder.
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+############################################################################
+#                                                                          #
+#  PyTCP - Python TCP/IP stack                                             #
+#  Copyright (C) 2020-present Sebastian Majewski                           #
+#                                                                          #
+#  This program is free software: you can redistribute it and/or modify    #
+#  it under the terms of the GNU General Public License as published by    #
+#  the Free Software Foundation, either version 3 of the License, or       #
+#  (at your option) any later version.                                     #
+#                                                                          #
+#  This program is distributed in the hope that it will be useful,         #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of          #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           #
+#  GNU General Public License for more details.                            #
+#                                                                          #
+#  You should have received a copy of the GNU General Public License       #
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.  #
+#                                                                          #
+#  Author's email: ccie18643@gmail.com                                     #
+#  Github repository: https://github.com/ccie18643/PyTCP                   #
+#                                                                          #
+############################################################################
+
+"""
+Module contains definition of socket type identifiers.
+
+pytcp/lib/socket_type.py
+
+ver 2.7
+"""
+
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class SocketType(IntEnum):
+    """
+    Socket type identifier enum.
+    """
+
+    SOCK_UNSPECIFIED = 0
+    SOCK_STREAM = 1
+    SOCK_DGRAM = 2
+
+    def __str__(self) -> str:
+        return str(self.name)
+
+
+SOCK_STREAM = SocketType.SOCK_STREAM
+SOCK_DGRAM = SocketType.SOCK_DGRAM
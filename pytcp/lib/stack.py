@@ -46,7 +46,9 @@ from pytcp.subsystems.tx_ring import TxRing
 
 if TYPE_CHECKING:
     from pytcp.lib.ip4_address import Ip4Address
+    from pytcp.lib.ip_address import IpAddress
     from pytcp.lib.socket import Socket
+    from pytcp.lib.socket_type import SocketType
 
 timer = Timer()
 rx_ring = RxRing()
@@ -55,5 +57,5 @@ arp_cache = ArpCache()
 nd_cache = NdCache()
 packet_handler = PacketHandler()
 
-sockets: dict[str, Socket] = {}
+sockets: dict[tuple[SocketType, IpAddress, int, IpAddress, int], Socket] = {}
 arp_probe_unicast_conflict: set[Ip4Address] = set()
@@ -66,15 +66,17 @@ class Tracker:
 
         assert prefix in {"RX", "TX"}
 
+        # The timestamp is only used to report latency in debug logs, so
+        # skip reading the clock for every packet when running with '-O'.
+        self._timestamp = time.time() if __debug__ else 0.0
+
         if prefix == "RX":
-            self._timestamp = time.time()
             self._serial = "<lg>" + f"RX{Tracker.serial_rx:0>4x}</>".upper()
             Tracker.serial_rx += 1
             if Tracker.serial_rx > 0xFFFF:
                 Tracker.serial_rx = 0
 
         if prefix == "TX":
-            self._timestamp = time.time()
             self._serial = "<lr>" + f"TX{Tracker.serial_tx:0>4x}</>".upper()
             Tracker.serial_tx += 1
             if Tracker.serial_tx > 0xFFFF:
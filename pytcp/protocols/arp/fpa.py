@@ -39,7 +39,7 @@ from __future__ import annotations
 import struct
 
 from pytcp.lib.ip4_address import Ip4Address
-from pytcp.lib.mac_address import MacAddress
+from pytcp.lib.mac_address import MAC_ZERO, MacAddress
 from pytcp.lib.tracker import Tracker
 from pytcp.protocols.arp.ps import ARP_HEADER_LEN, ARP_OP_REPLY, ARP_OP_REQUEST
 from pytcp.protocols.ether.ps import ETHER_TYPE_ARP
@@ -55,9 +55,9 @@ class ArpAssembler:
     def __init__(
         self,
         *,
-        sha: MacAddress = MacAddress(0),
+        sha: MacAddress = MAC_ZERO,
         spa: Ip4Address = Ip4Address(0),
-        tha: MacAddress = MacAddress(0),
+        tha: MacAddress = MAC_ZERO,
         tpa: Ip4Address = Ip4Address(0),
         oper: int = ARP_OP_REQUEST,
         echo_tracker: Tracker | None = None,
@@ -38,7 +38,7 @@ from __future__ import annotations
 import struct
 from typing import TYPE_CHECKING
 
-from pytcp.lib.mac_address import MacAddress
+from pytcp.lib.mac_address import MAC_ZERO, MacAddress
 from pytcp.protocols.ether.ps import (
     ETHER_HEADER_LEN,
     ETHER_TYPE_ARP,
@@ -64,8 +64,8 @@ class EtherAssembler:
     def __init__(
         self,
         *,
-        src: MacAddress = MacAddress(0),
-        dst: MacAddress = MacAddress(0),
+        src: MacAddress = MAC_ZERO,
+        dst: MacAddress = MAC_ZERO,
         carried_packet: ArpAssembler
         | Ip4Assembler
         | Ip4FragAssembler
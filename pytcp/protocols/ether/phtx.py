@@ -46,7 +46,7 @@ from typing import TYPE_CHECKING
 
 from pytcp.lib import stack
 from pytcp.lib.logger import log
-from pytcp.lib.mac_address import MacAddress
+from pytcp.lib.mac_address import MAC_BROADCAST, MAC_ZERO, MacAddress
 from pytcp.lib.tx_status import TxStatus
 from pytcp.protocols.ether.fpa import EtherAssembler
 from pytcp.protocols.ip4.fpa import Ip4Assembler, Ip4FragAssembler
@@ -66,8 +66,8 @@ def _send_out_packet(ether_packet_tx: EtherAssembler) -> None:
 def _phtx_ether(
     self: PacketHandler,
     *,
-    ether_src: MacAddress = MacAddress(0),
-    ether_dst: MacAddress = MacAddress(0),
+    ether_src: MacAddress = MAC_ZERO,
+    ether_dst: MacAddress = MAC_ZERO,
     carried_packet: ArpAssembler
     | Ip4Assembler
     | Ip4FragAssembler
@@ -224,7 +224,7 @@ def _phtx_ether(
             self.packet_stats_tx.ether__dst_unspec__ip4_lookup__limited_broadcast__send += (
                 1
             )
-            ether_packet_tx.dst = MacAddress(0xFFFFFFFFFFFF)
+            ether_packet_tx.dst = MAC_BROADCAST
             __debug__ and log(
                 "ether",
                 f"{ether_packet_tx.tracker} - Resolved destination IPv4 "
@@ -244,7 +244,7 @@ def _phtx_ether(
                     self.packet_stats_tx.ether__dst_unspec__ip4_lookup__network_broadcast__send += (
                         1
                     )
-                    ether_packet_tx.dst = MacAddress(0xFFFFFFFFFFFF)
+                    ether_packet_tx.dst = MAC_BROADCAST
                     __debug__ and log(
                         "ether",
                         f"{ether_packet_tx.tracker} - Resolved destination "
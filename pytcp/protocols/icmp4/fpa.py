@@ -48,15 +48,31 @@ from pytcp.protocols.icmp4.ps import (
     ICMP4_UNREACHABLE,
     ICMP4_UNREACHABLE__PORT,
     ICMP4_UNREACHABLE_LEN,
+    ICMP4_UNREACHABLE_MAX_DATA_LEN,
 )
 from pytcp.protocols.ip4.ps import IP4_PROTO_ICMP4
 
+ICMP4_ECHO_STRUCT = struct.Struct("! BBH HH")
+ICMP4_UNREACHABLE_STRUCT = struct.Struct("! BBH L")
+ICMP4_CKSUM_STRUCT = struct.Struct("! H")
+
 
 class Icmp4Assembler:
     """
     ICMPv4 packet assembler support class.
     """
 
+    __slots__ = (
+        "_tracker",
+        "_type",
+        "_code",
+        "_ec_id",
+        "_ec_seq",
+        "_ec_data",
+        "_un_data",
+        "_len",
+    )
+
     ip4_proto = IP4_PROTO_ICMP4
 
     def __init__(
@@ -66,8 +82,8 @@ class Icmp4Assembler:
         code: int = 0,
         ec_id: int | None = None,
         ec_seq: int | None = None,
-        ec_data: bytes | None = None,
-        un_data: bytes | None = None,
+        ec_data: bytes | memoryview | None = None,
+        un_data: bytes | memoryview | None = None,
         echo_tracker: Tracker | None = None,
     ) -> None:
         """Class constructor"""
@@ -84,19 +100,26 @@ class Icmp4Assembler:
             self._ec_id = 0 if ec_id is None else ec_id
             self._ec_seq = 0 if ec_seq is None else ec_seq
             self._ec_data = b"" if ec_data is None else ec_data
+            self._len = ICMP4_ECHO_REPLY_LEN + len(self._ec_data)
             return
 
         if (
             self._type == ICMP4_UNREACHABLE
             and self._code == ICMP4_UNREACHABLE__PORT
         ):
-            self._un_data = b"" if un_data is None else un_data[:520]
+            self._un_data = (
+                b""
+                if un_data is None
+                else un_data[:ICMP4_UNREACHABLE_MAX_DATA_LEN]
+            )
+            self._len = ICMP4_UNREACHABLE_LEN + len(self._un_data)
             return
 
         if self._type == ICMP4_ECHO_REQUEST and self._code == 0:
             self._ec_id = 0 if ec_id is None else ec_id
             self._ec_seq = 0 if ec_seq is None else ec_seq
             self._ec_data = b"" if ec_data is None else ec_data
+            self._len = ICMP4_ECHO_REQUEST_LEN + len(self._ec_data)
             return
 
         assert False, "Unknown ICMPv4 Type/Code"
@@ -105,20 +128,7 @@ class Icmp4Assembler:
         """
         Length of the packet.
         """
-
-        if self._type == ICMP4_ECHO_REPLY:
-            return ICMP4_ECHO_REPLY_LEN + len(self._ec_data)
-
-        if (
-            self._type == ICMP4_UNREACHABLE
-            and self._code == ICMP4_UNREACHABLE__PORT
-        ):
-            return ICMP4_UNREACHABLE_LEN + len(self._un_data)
-
-        if self._type == ICMP4_ECHO_REQUEST:
-            return ICMP4_ECHO_REQUEST_LEN + len(self._ec_data)
-
-        assert False, "Unknown ICMPv4 Type/Code"
+        return self._len
 
     def __str__(self) -> str:
         """
@@ -159,51 +169,38 @@ class Icmp4Assembler:
         Assemble packet into the raw form.
         """
 
-        if self._type == ICMP4_ECHO_REPLY and self._code == 0:
-            struct.pack_into(
-                f"! BBH HH {len(self._ec_data)}s",
-                frame,
-                0,
-                self._type,
-                self._code,
-                0,
-                self._ec_id,
-                self._ec_seq,
-                bytes(self._ec_data),
+        # Type/Code pairing has already been validated by the constructor,
+        # so the type alone is enough to pick the packet layout.
+        if self._type == ICMP4_ECHO_REPLY:
+            ICMP4_ECHO_STRUCT.pack_into(
+                frame, 0, self._type, self._code, 0, self._ec_id, self._ec_seq
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame))
+            frame[
+                ICMP4_ECHO_REPLY_LEN : ICMP4_ECHO_REPLY_LEN + len(self._ec_data)
+            ] = self._ec_data
+            ICMP4_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame))
             return
 
-        if (
-            self._type == ICMP4_UNREACHABLE
-            and self._code == ICMP4_UNREACHABLE__PORT
-        ):
-            struct.pack_into(
-                f"! BBH L {len(self._un_data)}s",
-                frame,
-                0,
-                self._type,
-                self._code,
-                0,
-                0,
-                bytes(self._un_data),
+        if self._type == ICMP4_UNREACHABLE:
+            ICMP4_UNREACHABLE_STRUCT.pack_into(
+                frame, 0, self._type, self._code, 0, 0
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame))
+            frame[
+                ICMP4_UNREACHABLE_LEN : ICMP4_UNREACHABLE_LEN
+                + len(self._un_data)
+            ] = self._un_data
+            ICMP4_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame))
             return
 
-        if self._type == ICMP4_ECHO_REQUEST and self._code == 0:
-            struct.pack_into(
-                f"! BBH HH {len(self._ec_data)}s",
-                frame,
-                0,
-                self._type,
-                self._code,
-                0,
-                self._ec_id,
-                self._ec_seq,
-                bytes(self._ec_data),
+        if self._type == ICMP4_ECHO_REQUEST:
+            ICMP4_ECHO_STRUCT.pack_into(
+                frame, 0, self._type, self._code, 0, self._ec_id, self._ec_seq
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame))
+            frame[
+                ICMP4_ECHO_REQUEST_LEN : ICMP4_ECHO_REQUEST_LEN
+                + len(self._ec_data)
+            ] = self._ec_data
+            ICMP4_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame))
             return
 
         assert False, "Unknown ICMPv4 Type/Code"
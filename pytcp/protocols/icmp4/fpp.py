@@ -54,6 +54,9 @@ from pytcp.protocols.icmp4.ps import (
 if TYPE_CHECKING:
     from pytcp.lib.packet import PacketRx
 
+ICMP4_U16_STRUCT = struct.Struct("!H")
+ICMP4_ECHO_ID_SEQ_STRUCT = struct.Struct("!HH")
+
 
 class Icmp4Parser:
     """
@@ -86,18 +89,19 @@ class Icmp4Parser:
         """
         Packet log string.
         """
-        header = f"ICMPv4 {self.type}/{self.code}"
+        icmp4_type, icmp4_code = self.type, self.code
+        header = f"ICMPv4 {icmp4_type}/{icmp4_code}"
 
-        if self.type == ICMP4_ECHO_REPLY:
+        if icmp4_type == ICMP4_ECHO_REPLY:
             return f"{header} (echo_reply), id {self.ec_id}, seq {self.ec_seq}, dlen {len(self.ec_data)}"
 
         if (
-            self.type == ICMP4_UNREACHABLE
-            and self.code == ICMP4_UNREACHABLE__PORT
+            icmp4_type == ICMP4_UNREACHABLE
+            and icmp4_code == ICMP4_UNREACHABLE__PORT
         ):
             return f"{header} (unreachable_port), dlen {len(self.un_data)}"
 
-        if self.type == ICMP4_ECHO_REQUEST:
+        if icmp4_type == ICMP4_ECHO_REQUEST:
             return f"{header} (echo_request), id {self.ec_id}, seq {self.ec_seq}, dlen {len(self.ec_data)}"
 
         return f"{header} (unknown)"
@@ -122,7 +126,9 @@ class Icmp4Parser:
         Read the 'Checksum' field.
         """
         if "_cache__cksum" not in self.__dict__:
-            self._cache__cksum: int = struct.unpack("!H", self._frame[2:4])[0]
+            self._cache__cksum: int = ICMP4_U16_STRUCT.unpack_from(
+                self._frame, 2
+            )[0]
         return self._cache__cksum
 
     @property
@@ -131,8 +137,7 @@ class Icmp4Parser:
         Read the Echo 'Id' field.
         """
         if "_cache__ec_id" not in self.__dict__:
-            assert self.type in {ICMP4_ECHO_REQUEST, ICMP4_ECHO_REPLY}
-            self._cache__ec_id: int = struct.unpack("!H", self._frame[4:6])[0]
+            self._read_ec_id_seq()
         return self._cache__ec_id
 
     @property
@@ -141,12 +146,20 @@ class Icmp4Parser:
         Read the Echo 'Seq' field.
         """
         if "_cache__ec_seq" not in self.__dict__:
-            assert self.type in {ICMP4_ECHO_REQUEST, ICMP4_ECHO_REPLY}
-            self._cache__ec_seq: int = struct.unpack("!H", self._frame[6:8])[0]
+            self._read_ec_id_seq()
         return self._cache__ec_seq
 
+    def _read_ec_id_seq(self) -> None:
+        """
+        Read the Echo 'Id' and 'Seq' fields with a single unpack.
+        """
+        assert self.type in {ICMP4_ECHO_REQUEST, ICMP4_ECHO_REPLY}
+        ec_id, ec_seq = ICMP4_ECHO_ID_SEQ_STRUCT.unpack_from(self._frame, 4)
+        self._cache__ec_id: int = ec_id
+        self._cache__ec_seq: int = ec_seq
+
     @property
-    def ec_data(self) -> bytes:
+    def ec_data(self) -> memoryview:
         """
         Read data carried by the Echo message.
         """
@@ -156,7 +169,7 @@ class Icmp4Parser:
         return self._cache__ec_data
 
     @property
-    def un_data(self) -> bytes:
+    def un_data(self) -> memoryview:
         """
         Read the data carried by Uneachable message.
         """
@@ -190,7 +203,9 @@ class Icmp4Parser:
         if not config.PACKET_INTEGRITY_CHECK:
             return ""
 
-        if inet_cksum(self._frame[: self._plen]):
+        if config.PACKET_CHECKSUM_CHECK and inet_cksum(
+            self._frame[: self._plen]
+        ):
             return "ICMPv4 integrity - wrong packet checksum"
 
         if not ICMP4_HEADER_LEN <= self._plen <= len(self):
@@ -220,24 +235,7 @@ class Icmp4Parser:
                 return "ICMPv4 sanity - 'code' should be set to 0 (RFC 792)"
 
         if self.type == ICMP4_UNREACHABLE:
-            if self.code not in {
-                0,
-                1,
-                2,
-                3,
-                4,
-                5,
-                6,
-                7,
-                8,
-                9,
-                10,
-                11,
-                12,
-                13,
-                14,
-                15,
-            }:
+            if not 0 <= self.code <= 15:
                 return "ICMPv4 sanity - 'code' must be set to [0-15] (RFC 792)"
 
         return ""
@@ -37,7 +37,6 @@ ver 2.7
 
 from __future__ import annotations
 
-import struct
 from typing import TYPE_CHECKING
 
 from pytcp.lib import stack
@@ -51,7 +50,7 @@ from pytcp.protocols.icmp4.ps import (
 )
 from pytcp.protocols.ip4.ps import IP4_HEADER_LEN, IP4_PROTO_UDP
 from pytcp.protocols.udp.metadata import UdpMetadata
-from pytcp.protocols.udp.ps import UDP_HEADER_LEN
+from pytcp.protocols.udp.ps import UDP_HEADER_LEN, UDP_PORTS_STRUCT
 
 if TYPE_CHECKING:
     from pytcp.lib.packet import PacketRx
@@ -75,8 +74,10 @@ def _phrx_icmp4(self: PacketHandler, packet_rx: PacketRx) -> None:
 
     __debug__ and log("icmp4", f"{packet_rx.tracker} - {packet_rx.icmp4}")
 
+    icmp4_type = packet_rx.icmp4.type
+
     # ICMPv4 Echo Request packet
-    if packet_rx.icmp4.type == ICMP4_ECHO_REQUEST:
+    if icmp4_type == ICMP4_ECHO_REQUEST:
         __debug__ and log(
             "icmp4",
             f"{packet_rx.tracker} - <INFO>Received ICMPv4 Echo Request "
@@ -96,7 +97,7 @@ def _phrx_icmp4(self: PacketHandler, packet_rx: PacketRx) -> None:
         return
 
     # ICMPv4 Unreachable packet
-    if packet_rx.icmp4.type == ICMP4_UNREACHABLE:
+    if icmp4_type == ICMP4_UNREACHABLE:
         __debug__ and log(
             "icmp4",
             f"{packet_rx.tracker} - Received ICMPv4 Unreachable packet "
@@ -115,16 +116,14 @@ def _phrx_icmp4(self: PacketHandler, packet_rx: PacketRx) -> None:
             and len(frame) >= ((frame[0] & 0b00001111) << 2) + UDP_HEADER_LEN
         ):
             # Create UdpMetadata object and try to find matching UDP socket
-            udp_offset = (frame[0] & 0b00001111) << 2
+            local_port, remote_port = UDP_PORTS_STRUCT.unpack_from(
+                frame, (frame[0] & 0b00001111) << 2
+            )
             packet = UdpMetadata(
                 local_ip_address=Ip4Address(frame[12:16]),
                 remote_ip_address=Ip4Address(frame[16:20]),
-                local_port=struct.unpack(
-                    "!H", frame[udp_offset + 0 : udp_offset + 2]
-                )[0],
-                remote_port=struct.unpack(
-                    "!H", frame[udp_offset + 2 : udp_offset + 4]
-                )[0],
+                local_port=local_port,
+                remote_port=remote_port,
             )
 
             for socket_pattern in packet.socket_patterns:
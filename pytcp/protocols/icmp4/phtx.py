@@ -65,8 +65,8 @@ def _phtx_icmp4(
     icmp4_code: int = 0,
     icmp4_ec_id: int | None = None,
     icmp4_ec_seq: int | None = None,
-    icmp4_ec_data: bytes | None = None,
-    icmp4_un_data: bytes | None = None,
+    icmp4_ec_data: bytes | memoryview | None = None,
+    icmp4_un_data: bytes | memoryview | None = None,
     echo_tracker: Tracker | None = None,
 ) -> TxStatus:
     """
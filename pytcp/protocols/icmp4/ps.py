@@ -84,6 +84,7 @@ ICMP4_ECHO_REPLY = 0
 ICMP4_ECHO_REPLY_LEN = 8
 ICMP4_UNREACHABLE = 3
 ICMP4_UNREACHABLE_LEN = 8
+ICMP4_UNREACHABLE_MAX_DATA_LEN = 520
 ICMP4_UNREACHABLE__NET = 0
 ICMP4_UNREACHABLE__HOST = 1
 ICMP4_UNREACHABLE__PROTOCOL = 2
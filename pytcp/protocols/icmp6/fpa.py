@@ -76,12 +76,52 @@ from pytcp.protocols.ip6.ps import IP6_NEXT_ICMP6
 if TYPE_CHECKING:
     from pytcp.lib.mac_address import MacAddress
 
+ICMP6_ECHO_STRUCT = struct.Struct("! BBH HH")
+ICMP6_UNREACHABLE_STRUCT = struct.Struct("! BBH L")
+ICMP6_ND_RS_STRUCT = ICMP6_UNREACHABLE_STRUCT
+ICMP6_ND_RA_STRUCT = struct.Struct("! BBH BBH L L")
+ICMP6_ND_NS_NA_STRUCT = struct.Struct("! BBH L 16s")
+ICMP6_MLD2_REPORT_STRUCT = ICMP6_ECHO_STRUCT
+ICMP6_CKSUM_STRUCT = struct.Struct("! H")
+ICMP6_ND_OPT_LLA_STRUCT = struct.Struct("! BB 6s")
+ICMP6_ND_OPT_PI_STRUCT = struct.Struct("! BB BB L L L 16s")
+
 
 class Icmp6Assembler:
     """
     ICMPv6 packet assembler support class.
     """
 
+    __slots__ = (
+        "_tracker",
+        "_type",
+        "_code",
+        "_un_reserved",
+        "_un_data",
+        "_ec_id",
+        "_ec_seq",
+        "_ec_data",
+        "_rs_reserved",
+        "_ra_hop",
+        "_ra_flag_m",
+        "_ra_flag_o",
+        "_ra_router_lifetime",
+        "_ra_reachable_time",
+        "_ra_retrans_timer",
+        "_ns_reserved",
+        "_ns_target_address",
+        "_na_flag_r",
+        "_na_flag_s",
+        "_na_flag_o",
+        "_na_reserved",
+        "_na_target_address",
+        "_nd_options",
+        "_mlr2_reserved",
+        "_mlr2_multicast_address_record",
+        "_mlr2_number_of_multicast_address_records",
+        "_len",
+    )
+
     ip6_next = IP6_NEXT_ICMP6
 
     def __init__(
@@ -89,10 +129,10 @@ class Icmp6Assembler:
         *,
         type: int = 128,
         code: int = 0,
-        un_data: bytes | None = None,
+        un_data: bytes | memoryview | None = None,
         ec_id: int | None = None,
         ec_seq: int | None = None,
-        ec_data: bytes | None = None,
+        ec_data: bytes | memoryview | None = None,
         ra_hop: int | None = None,
         ra_flag_m: bool | None = None,
         ra_flag_o: bool | None = None,
@@ -125,6 +165,7 @@ class Icmp6Assembler:
         ):
             self._un_reserved = 0
             self._un_data = b"" if un_data is None else un_data[:520]
+            self._len = ICMP6_UNREACHABLE_LEN + len(self._un_data)
 
             return
 
@@ -136,6 +177,8 @@ class Icmp6Assembler:
             assert 0 <= self._ec_id <= 0xFFFF
             assert 0 <= self._ec_seq <= 0xFFFF
 
+            self._len = ICMP6_ECHO_REQUEST_LEN + len(self._ec_data)
+
             return
 
         if self._type == ICMP6_ECHO_REPLY and self._code == 0:
@@ -146,11 +189,16 @@ class Icmp6Assembler:
             assert 0 <= self._ec_id <= 0xFFFF
             assert 0 <= self._ec_seq <= 0xFFFF
 
+            self._len = ICMP6_ECHO_REPLY_LEN + len(self._ec_data)
+
             return
 
         if self._type == ICMP6_ND_ROUTER_SOLICITATION and self._code == 0:
             self._rs_reserved = 0
             self._nd_options = [] if nd_options is None else nd_options
+            self._len = ICMP6_ND_ROUTER_SOLICITATION_LEN + sum(
+                len(_) for _ in self._nd_options
+            )
 
             return
 
@@ -168,6 +216,9 @@ class Icmp6Assembler:
                 0 if ra_retrans_timer is None else ra_retrans_timer
             )
             self._nd_options = [] if nd_options is None else nd_options
+            self._len = ICMP6_ND_ROUTER_ADVERTISEMENT_LEN + sum(
+                len(_) for _ in self._nd_options
+            )
 
             assert 0 <= self._ra_hop <= 0xFF
             assert 0 <= self._ra_router_lifetime <= 0xFFFF
@@ -184,6 +235,9 @@ class Icmp6Assembler:
                 else ns_target_address
             )
             self._nd_options = [] if nd_options is None else nd_options
+            self._len = ICMP6_ND_NEIGHBOR_SOLICITATION_LEN + sum(
+                len(_) for _ in self._nd_options
+            )
 
             return
 
@@ -198,6 +252,9 @@ class Icmp6Assembler:
                 else na_target_address
             )
             self._nd_options = [] if nd_options is None else nd_options
+            self._len = ICMP6_ND_NEIGHBOR_ADVERTISEMENT_LEN + sum(
+                len(_) for _ in self._nd_options
+            )
 
             return
 
@@ -211,6 +268,9 @@ class Icmp6Assembler:
             self._mlr2_number_of_multicast_address_records = len(
                 self._mlr2_multicast_address_record
             )
+            self._len = ICMP6_MLD2_REPORT_LEN + sum(
+                len(_) for _ in self._mlr2_multicast_address_record
+            )
 
             return
 
@@ -221,48 +281,7 @@ class Icmp6Assembler:
         Length of the packet.
         """
 
-        if (
-            self._type == ICMP6_UNREACHABLE
-            and self._code == ICMP6_UNREACHABLE__PORT
-        ):
-            return ICMP6_UNREACHABLE_LEN + len(self._un_data)
-
-        if self._type == ICMP6_ECHO_REQUEST and self._code == 0:
-            return ICMP6_ECHO_REQUEST_LEN + len(self._ec_data)
-
-        if self._type == ICMP6_ECHO_REPLY and self._code == 0:
-            return ICMP6_ECHO_REPLY_LEN + len(self._ec_data)
-
-        if self._type == ICMP6_ND_ROUTER_SOLICITATION and self._code == 0:
-            assert self._nd_options is not None
-            return ICMP6_ND_ROUTER_SOLICITATION_LEN + sum(
-                len(_) for _ in self._nd_options
-            )
-
-        if self._type == ICMP6_ND_ROUTER_ADVERTISEMENT and self._code == 0:
-            assert self._nd_options is not None
-            return ICMP6_ND_ROUTER_ADVERTISEMENT_LEN + sum(
-                len(_) for _ in self._nd_options
-            )
-
-        if self._type == ICMP6_ND_NEIGHBOR_SOLICITATION and self._code == 0:
-            assert self._nd_options is not None
-            return ICMP6_ND_NEIGHBOR_SOLICITATION_LEN + sum(
-                len(_) for _ in self._nd_options
-            )
-
-        if self._type == ICMP6_ND_NEIGHBOR_ADVERTISEMENT and self._code == 0:
-            assert self._nd_options is not None
-            return ICMP6_ND_NEIGHBOR_ADVERTISEMENT_LEN + sum(
-                len(_) for _ in self._nd_options
-            )
-
-        if self._type == ICMP6_MLD2_REPORT and self._code == 0:
-            return ICMP6_MLD2_REPORT_LEN + sum(
-                len(_) for _ in self._mlr2_multicast_address_record
-            )
-
-        assert False, "Unknown ICMPv4 Type/Code"
+        return self._len
 
     def __str__(self) -> str:
         """
@@ -355,66 +374,48 @@ class Icmp6Assembler:
             self._type == ICMP6_UNREACHABLE
             and self._code == ICMP6_UNREACHABLE__PORT
         ):
-            struct.pack_into(
-                f"! BBH L {len(self._un_data)}s",
-                frame,
-                0,
-                self._type,
-                self._code,
-                0,
-                self._un_reserved,
-                self._un_data,
+            ICMP6_UNREACHABLE_STRUCT.pack_into(
+                frame, 0, self._type, self._code, 0, self._un_reserved
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
+            frame[
+                ICMP6_UNREACHABLE_LEN : ICMP6_UNREACHABLE_LEN
+                + len(self._un_data)
+            ] = self._un_data
+            ICMP6_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         if self._type == ICMP6_ECHO_REQUEST and self._code == 0:
-            struct.pack_into(
-                f"! BBH HH {len(self._ec_data)}s",
-                frame,
-                0,
-                self._type,
-                self._code,
-                0,
-                self._ec_id,
-                self._ec_seq,
-                self._ec_data,
+            ICMP6_ECHO_STRUCT.pack_into(
+                frame, 0, self._type, self._code, 0, self._ec_id, self._ec_seq
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
+            frame[
+                ICMP6_ECHO_REQUEST_LEN : ICMP6_ECHO_REQUEST_LEN
+                + len(self._ec_data)
+            ] = self._ec_data
+            ICMP6_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         if self._type == ICMP6_ECHO_REPLY and self._code == 0:
-            struct.pack_into(
-                f"! BBH HH {len(self._ec_data)}s",
-                frame,
-                0,
-                self._type,
-                self._code,
-                0,
-                self._ec_id,
-                self._ec_seq,
-                bytes(self._ec_data),
+            ICMP6_ECHO_STRUCT.pack_into(
+                frame, 0, self._type, self._code, 0, self._ec_id, self._ec_seq
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
+            frame[
+                ICMP6_ECHO_REPLY_LEN : ICMP6_ECHO_REPLY_LEN
+                + len(self._ec_data)
+            ] = self._ec_data
+            ICMP6_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         if self._type == ICMP6_ND_ROUTER_SOLICITATION and self._code == 0:
-            struct.pack_into(
-                f"! BBH L {len(self._raw_nd_options)}s",
-                frame,
-                0,
-                self._type,
-                self._code,
-                0,
-                self._rs_reserved,
-                self._raw_nd_options,
+            ICMP6_ND_RS_STRUCT.pack_into(
+                frame, 0, self._type, self._code, 0, self._rs_reserved
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
+            self._assemble_nd_options(frame, ICMP6_ND_ROUTER_SOLICITATION_LEN)
+            ICMP6_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         if self._type == ICMP6_ND_ROUTER_ADVERTISEMENT and self._code == 0:
-            struct.pack_into(
-                f"! BBH BBH L L {len(self._raw_nd_options)}s",
+            ICMP6_ND_RA_STRUCT.pack_into(
                 frame,
                 0,
                 self._type,
@@ -425,14 +426,13 @@ class Icmp6Assembler:
                 self._ra_router_lifetime,
                 self._ra_reachable_time,
                 self._ra_retrans_timer,
-                self._raw_nd_options,
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
+            self._assemble_nd_options(frame, ICMP6_ND_ROUTER_ADVERTISEMENT_LEN)
+            ICMP6_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         if self._type == ICMP6_ND_NEIGHBOR_SOLICITATION and self._code == 0:
-            struct.pack_into(
-                f"! BBH L 16s {len(self._raw_nd_options)}s",
+            ICMP6_ND_NS_NA_STRUCT.pack_into(
                 frame,
                 0,
                 self._type,
@@ -440,14 +440,13 @@ class Icmp6Assembler:
                 0,
                 self._ns_reserved,
                 bytes(self._ns_target_address),
-                self._raw_nd_options,
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
+            self._assemble_nd_options(frame, ICMP6_ND_NEIGHBOR_SOLICITATION_LEN)
+            ICMP6_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         if self._type == ICMP6_ND_NEIGHBOR_ADVERTISEMENT and self._code == 0:
-            struct.pack_into(
-                f"! BBH L 16s {len(self._raw_nd_options)}s",
+            ICMP6_ND_NS_NA_STRUCT.pack_into(
                 frame,
                 0,
                 self._type,
@@ -458,14 +457,15 @@ class Icmp6Assembler:
                 | (self._na_flag_o << 29)
                 | self._na_reserved,
                 bytes(self._na_target_address),
-                self._raw_nd_options,
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
+            self._assemble_nd_options(
+                frame, ICMP6_ND_NEIGHBOR_ADVERTISEMENT_LEN
+            )
+            ICMP6_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         if self._type == ICMP6_MLD2_REPORT and self._code == 0:
-            struct.pack_into(
-                f"! BBH HH {sum((len(_) for _ in self._mlr2_multicast_address_record))}s",
+            ICMP6_MLD2_REPORT_STRUCT.pack_into(
                 frame,
                 0,
                 self._type,
@@ -473,21 +473,22 @@ class Icmp6Assembler:
                 0,
                 self._mlr2_reserved,
                 self._mlr2_number_of_multicast_address_records,
-                b"".join(
-                    [_.raw_record for _ in self._mlr2_multicast_address_record]
-                ),
             )
-            struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
+            frame[ICMP6_MLD2_REPORT_LEN : self._len] = b"".join(
+                [_.raw_record for _ in self._mlr2_multicast_address_record]
+            )
+            ICMP6_CKSUM_STRUCT.pack_into(frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         assert False, "Unknown ICMPv4 Type/Code"
 
-    @property
-    def _raw_nd_options(self) -> bytes:
+    def _assemble_nd_options(self, frame: memoryview, optr: int) -> None:
         """
-        ICMPv6 ND packet options in raw format.
+        Assemble ICMPv6 ND packet options straight into the frame.
         """
-        return b"".join(bytes(option) for option in self._nd_options)
+        for option in self._nd_options:
+            option.assemble(frame, optr)
+            optr += len(option)
 
 
 #
@@ -528,8 +529,19 @@ class Icmp6NdOptSLLA:
         """
         Option in raw form.
         """
-        return struct.pack(
-            "! BB 6s",
+        return ICMP6_ND_OPT_LLA_STRUCT.pack(
+            ICMP6_ND_OPT_SLLA,
+            ICMP6_ND_OPT_SLLA_LEN >> 3,
+            bytes(self._slla),
+        )
+
+    def assemble(self, frame: memoryview, optr: int) -> None:
+        """
+        Assemble option into the frame at the given offset.
+        """
+        ICMP6_ND_OPT_LLA_STRUCT.pack_into(
+            frame,
+            optr,
             ICMP6_ND_OPT_SLLA,
             ICMP6_ND_OPT_SLLA_LEN >> 3,
             bytes(self._slla),
@@ -575,8 +587,19 @@ class Icmp6NdOptTLLA:
         """
         Option in raw form.
         """
-        return struct.pack(
-            "! BB 6s",
+        return ICMP6_ND_OPT_LLA_STRUCT.pack(
+            ICMP6_ND_OPT_TLLA,
+            ICMP6_ND_OPT_TLLA_LEN >> 3,
+            bytes(self._tlla),
+        )
+
+    def assemble(self, frame: memoryview, optr: int) -> None:
+        """
+        Assemble option into the frame at the given offset.
+        """
+        ICMP6_ND_OPT_LLA_STRUCT.pack_into(
+            frame,
+            optr,
             ICMP6_ND_OPT_TLLA,
             ICMP6_ND_OPT_TLLA_LEN >> 3,
             bytes(self._tlla),
@@ -651,12 +674,28 @@ class Icmp6NdOptPI:
         """
         Option in raw form.
         """
-        return struct.pack(
-            "! BB BB L L L 16s",
+        return ICMP6_ND_OPT_PI_STRUCT.pack(
+            self._code,
+            self._len >> 3,
+            len(self._prefix.mask),
+            (self._flag_l << 7) | (self._flag_a << 6) | (self._flag_r << 5),
+            self._valid_lifetime,
+            self._prefer_lifetime,
+            0,
+            bytes(self._prefix.address),
+        )
+
+    def assemble(self, frame: memoryview, optr: int) -> None:
+        """
+        Assemble option into the frame at the given offset.
+        """
+        ICMP6_ND_OPT_PI_STRUCT.pack_into(
+            frame,
+            optr,
             self._code,
             self._len >> 3,
             len(self._prefix.mask),
-            (self._flag_l << 7) | (self._flag_a << 6) | (self._flag_r << 6),
+            (self._flag_l << 7) | (self._flag_a << 6) | (self._flag_r << 5),
             self._valid_lifetime,
             self._prefer_lifetime,
             0,
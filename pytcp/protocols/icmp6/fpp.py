@@ -44,7 +44,13 @@ import struct
 from typing import TYPE_CHECKING
 
 from pytcp import config
-from pytcp.lib.ip6_address import Ip6Address, Ip6Mask, Ip6Network
+from pytcp.lib.ip6_address import (
+    IP6_ALL_NODES,
+    IP6_ALL_ROUTERS,
+    Ip6Address,
+    Ip6Mask,
+    Ip6Network,
+)
 from pytcp.lib.ip_helper import inet_cksum
 from pytcp.lib.mac_address import MacAddress
 from pytcp.protocols.icmp6.ps import (
@@ -70,6 +76,45 @@ from pytcp.protocols.icmp6.ps import (
 if TYPE_CHECKING:
     from pytcp.lib.packet import PacketRx
 
+ICMP6_U16_STRUCT = struct.Struct("!H")
+ICMP6_ECHO_ID_SEQ_STRUCT = struct.Struct("!HH")
+ICMP6_U32_STRUCT = struct.Struct("!L")
+ICMP6_MLD2_RECORD_STRUCT = struct.Struct("!BBH")
+
+ICMP6_ECHO_TYPES = frozenset({ICMP6_ECHO_REQUEST, ICMP6_ECHO_REPLY})
+ICMP6_ND_TYPES = frozenset(
+    {
+        ICMP6_ND_ROUTER_SOLICITATION,
+        ICMP6_ND_ROUTER_ADVERTISEMENT,
+        ICMP6_ND_NEIGHBOR_SOLICITATION,
+        ICMP6_ND_NEIGHBOR_ADVERTISEMENT,
+    }
+)
+
+ICMP6_PACKET_MIN_LEN = tuple(
+    {
+        ICMP6_UNREACHABLE: 12,
+        ICMP6_ECHO_REQUEST: 8,
+        ICMP6_ECHO_REPLY: 8,
+        ICMP6_MLD2_QUERY: 28,
+        ICMP6_ND_ROUTER_SOLICITATION: 8,
+        ICMP6_ND_ROUTER_ADVERTISEMENT: 16,
+        ICMP6_ND_NEIGHBOR_SOLICITATION: 24,
+        ICMP6_ND_NEIGHBOR_ADVERTISEMENT: 24,
+        ICMP6_MLD2_REPORT: 8,
+    }.get(icmp6_type)
+    for icmp6_type in range(256)
+)
+
+ICMP6_ND_OPT_PI_MASKS = tuple(Ip6Mask(f"/{_}") for _ in range(129))
+
+ICMP6_ND_OPTIONS_OFFSET = {
+    ICMP6_ND_ROUTER_SOLICITATION: 12,
+    ICMP6_ND_ROUTER_ADVERTISEMENT: 16,
+    ICMP6_ND_NEIGHBOR_SOLICITATION: 24,
+    ICMP6_ND_NEIGHBOR_ADVERTISEMENT: 24,
+}
+
 
 class Icmp6Parser:
     """
@@ -105,27 +150,28 @@ class Icmp6Parser:
         Packet log string.
         """
 
-        header = f"ICMPv6 {self.type}/{self.code}"
+        icmp6_type, icmp6_code = self.type, self.code
+        header = f"ICMPv6 {icmp6_type}/{icmp6_code}"
 
         if (
-            self.type == ICMP6_UNREACHABLE
-            and self.code == ICMP6_UNREACHABLE__PORT
+            icmp6_type == ICMP6_UNREACHABLE
+            and icmp6_code == ICMP6_UNREACHABLE__PORT
         ):
             return f"{header} (unreachable_port), dlen {len(self.un_data)}"
 
-        if self.type == ICMP6_ECHO_REQUEST:
+        if icmp6_type == ICMP6_ECHO_REQUEST:
             return (
                 f"{header} (echo_request), id {self.ec_id}, "
                 f"seq {self.ec_seq}, dlen {len(self.ec_data)}"
             )
 
-        if self.type == ICMP6_ECHO_REPLY:
+        if icmp6_type == ICMP6_ECHO_REPLY:
             return (
                 f"{header} (echo_reply), id {self.ec_id}, "
                 f"seq {self.ec_seq}, dlen {len(self.ec_data)}"
             )
 
-        if self.type == ICMP6_ND_ROUTER_SOLICITATION:
+        if icmp6_type == ICMP6_ND_ROUTER_SOLICITATION:
             nd_options = ", ".join(
                 str(nd_option) for nd_option in self.nd_options
             )
@@ -133,7 +179,7 @@ class Icmp6Parser:
                 f", {nd_options}" if nd_options else ""
             )
 
-        if self.type == ICMP6_ND_ROUTER_ADVERTISEMENT:
+        if icmp6_type == ICMP6_ND_ROUTER_ADVERTISEMENT:
             nd_options = ", ".join(
                 str(nd_option) for nd_option in self.nd_options
             )
@@ -147,7 +193,7 @@ class Icmp6Parser:
                 f"{nd_options if nd_options else ''}"
             )
 
-        if self.type == ICMP6_ND_NEIGHBOR_SOLICITATION:
+        if icmp6_type == ICMP6_ND_NEIGHBOR_SOLICITATION:
             nd_options = ", ".join(
                 str(nd_option) for nd_option in self.nd_options
             )
@@ -157,7 +203,7 @@ class Icmp6Parser:
                 f"{nd_options if nd_options else ''}"
             )
 
-        if self.type == ICMP6_ND_NEIGHBOR_ADVERTISEMENT:
+        if icmp6_type == ICMP6_ND_NEIGHBOR_ADVERTISEMENT:
             nd_options = ", ".join(
                 str(nd_option) for nd_option in self.nd_options
             )
@@ -170,7 +216,7 @@ class Icmp6Parser:
                 f"{nd_options if nd_options else ''}"
             )
 
-        if self.type == ICMP6_MLD2_REPORT:
+        if icmp6_type == ICMP6_MLD2_REPORT:
             return f"{header} (mld2_report)"
 
         return f"{header} (unknown)"
@@ -195,11 +241,13 @@ class Icmp6Parser:
         Read the 'Checksum' field.
         """
         if "_cache__cksum" not in self.__dict__:
-            self._cache__cksum: int = struct.unpack("!H", self._frame[2:4])[0]
+            self._cache__cksum: int = ICMP6_U16_STRUCT.unpack_from(
+                self._frame, 2
+            )[0]
         return self._cache__cksum
 
     @property
-    def un_data(self) -> bytes:
+    def un_data(self) -> memoryview:
         """
         Read data carried by the Unreachable message.
         """
@@ -214,8 +262,7 @@ class Icmp6Parser:
         Read the Echo 'Id' field.
         """
         if "_cache__ec_id" not in self.__dict__:
-            assert self.type in {ICMP6_ECHO_REQUEST, ICMP6_ECHO_REPLY}
-            self._cache__ec_id: int = struct.unpack("!H", self._frame[4:6])[0]
+            self._read_ec_id_seq()
         return self._cache__ec_id
 
     @property
@@ -224,17 +271,25 @@ class Icmp6Parser:
         Read the Echo 'Seq' field.
         """
         if "_cache__ec_seq" not in self.__dict__:
-            assert self.type in {ICMP6_ECHO_REQUEST, ICMP6_ECHO_REPLY}
-            self._cache__ec_seq: int = struct.unpack("!H", self._frame[6:8])[0]
+            self._read_ec_id_seq()
         return self._cache__ec_seq
 
+    def _read_ec_id_seq(self) -> None:
+        """
+        Read the Echo 'Id' and 'Seq' fields with a single unpack.
+        """
+        assert self.type in ICMP6_ECHO_TYPES
+        ec_id, ec_seq = ICMP6_ECHO_ID_SEQ_STRUCT.unpack_from(self._frame, 4)
+        self._cache__ec_id: int = ec_id
+        self._cache__ec_seq: int = ec_seq
+
     @property
-    def ec_data(self) -> bytes:
+    def ec_data(self) -> memoryview:
         """
         Read data carried by Echo message.
         """
         if "_cache__ec_data" not in self.__dict__:
-            assert self.type in {ICMP6_ECHO_REQUEST, ICMP6_ECHO_REPLY}
+            assert self.type in ICMP6_ECHO_TYPES
             self._cache__ec_data = self._frame[8 : self.plen]
         return self._cache__ec_data
 
@@ -273,8 +328,8 @@ class Icmp6Parser:
         """
         if "_cache__ra_router_lifetime" not in self.__dict__:
             assert self.type == ICMP6_ND_ROUTER_ADVERTISEMENT
-            self._cache__ra_router_lifetime: int = struct.unpack(
-                "!H", self._frame[6:8]
+            self._cache__ra_router_lifetime: int = ICMP6_U16_STRUCT.unpack_from(
+                self._frame, 6
             )[0]
         return self._cache__ra_router_lifetime
 
@@ -285,8 +340,8 @@ class Icmp6Parser:
         """
         if "_cache__ra_reachable_time" not in self.__dict__:
             assert self.type == ICMP6_ND_ROUTER_ADVERTISEMENT
-            self._cache__ra_reachable_time: int = struct.unpack(
-                "!L", self._frame[8:12]
+            self._cache__ra_reachable_time: int = ICMP6_U32_STRUCT.unpack_from(
+                self._frame, 8
             )[0]
         return self._cache__ra_reachable_time
 
@@ -297,8 +352,8 @@ class Icmp6Parser:
         """
         if "_cache__ra_retrans_timer" not in self.__dict__:
             assert self.type == ICMP6_ND_ROUTER_ADVERTISEMENT
-            self._cache__ra_retrans_timer: int = struct.unpack(
-                "!L", self._frame[12:16]
+            self._cache__ra_retrans_timer: int = ICMP6_U32_STRUCT.unpack_from(
+                self._frame, 12
             )[0]
         return self._cache__ra_retrans_timer
 
@@ -359,8 +414,8 @@ class Icmp6Parser:
         """
         if "_cache__mld2_rep_nor" not in self.__dict__:
             assert self.type == ICMP6_MLD2_REPORT
-            self._cache__mld2_rep_nor: int = struct.unpack(
-                "!H", self._frame[6:8]
+            self._cache__mld2_rep_nor: int = ICMP6_U16_STRUCT.unpack_from(
+                self._frame, 6
             )[0]
         return self._cache__mld2_rep_nor
 
@@ -385,18 +440,31 @@ class Icmp6Parser:
         """
         Read ND options - helper.
         """
+        frame = self._frame
+        frame_len = len(frame)
+        nd_opt_class = ICMP6_ND_OPT_CLASSES.get
         nd_options: list = []
-        while optr < len(self._frame):
+        while optr < frame_len:
             nd_options.append(
-                {
-                    ICMP6_ND_OPT_SLLA: Icmp6NdOptSLLA,
-                    ICMP6_ND_OPT_TLLA: Icmp6NdOptTLLA,
-                    ICMP6_ND_OPT_PI: Icmp6NdOptPI,
-                }.get(self._frame[optr], Icmp6NdOptUnk)(self._frame[optr:])
+                nd_opt_class(frame[optr], Icmp6NdOptUnk)(frame[optr:])
             )
-            optr += self._frame[optr + 1] << 3
+            optr += frame[optr + 1] << 3
         return nd_options
 
+    def _find_nd_option(self, code: int) -> memoryview | None:
+        """
+        Find first ND option of given code without parsing the other
+        options - helper.
+        """
+        frame = self._frame
+        frame_len = len(frame)
+        optr = ICMP6_ND_OPTIONS_OFFSET[self.type]
+        while optr < frame_len:
+            if frame[optr] == code:
+                return frame[optr:]
+            optr += frame[optr + 1] << 3
+        return None
+
     @property
     def nd_options(
         self,
@@ -405,19 +473,10 @@ class Icmp6Parser:
         Read ND options.
         """
         if "_cache__nd_options" not in self.__dict__:
-            assert self.type in {
-                ICMP6_ND_ROUTER_SOLICITATION,
-                ICMP6_ND_ROUTER_ADVERTISEMENT,
-                ICMP6_ND_NEIGHBOR_SOLICITATION,
-                ICMP6_ND_NEIGHBOR_ADVERTISEMENT,
-            }
-            optr = {
-                ICMP6_ND_ROUTER_SOLICITATION: 12,
-                ICMP6_ND_ROUTER_ADVERTISEMENT: 16,
-                ICMP6_ND_NEIGHBOR_SOLICITATION: 24,
-                ICMP6_ND_NEIGHBOR_ADVERTISEMENT: 24,
-            }[self.type]
-            self._cache__nd_options = self._read_nd_options(optr)
+            assert self.type in ICMP6_ND_TYPES
+            self._cache__nd_options = self._read_nd_options(
+                ICMP6_ND_OPTIONS_OFFSET[self.type]
+            )
         return self._cache__nd_options
 
     @property
@@ -426,18 +485,11 @@ class Icmp6Parser:
         ICMPv6 ND option - Source Link Layer Address (1).
         """
         if "_cache__nd_opt_slla" not in self.__dict__:
-            assert self.type in {
-                ICMP6_ND_ROUTER_SOLICITATION,
-                ICMP6_ND_ROUTER_ADVERTISEMENT,
-                ICMP6_ND_NEIGHBOR_SOLICITATION,
-                ICMP6_ND_NEIGHBOR_ADVERTISEMENT,
-            }
-            for option in self.nd_options:
-                if isinstance(option, Icmp6NdOptSLLA):
-                    self._cache__nd_opt_slla: MacAddress | None = option.slla
-                    break
-            else:
-                self._cache__nd_opt_slla = None
+            assert self.type in ICMP6_ND_TYPES
+            option = self._find_nd_option(ICMP6_ND_OPT_SLLA)
+            self._cache__nd_opt_slla: MacAddress | None = (
+                None if option is None else MacAddress(option[2:8])
+            )
         return self._cache__nd_opt_slla
 
     @property
@@ -446,18 +498,11 @@ class Icmp6Parser:
         ICMPv6 ND option - Target Link Layer Address (2).
         """
         if "_cache__nd_opt_tlla" not in self.__dict__:
-            assert self.type in {
-                ICMP6_ND_ROUTER_SOLICITATION,
-                ICMP6_ND_ROUTER_ADVERTISEMENT,
-                ICMP6_ND_NEIGHBOR_SOLICITATION,
-                ICMP6_ND_NEIGHBOR_ADVERTISEMENT,
-            }
-            for option in self.nd_options:
-                if isinstance(option, Icmp6NdOptTLLA):
-                    self._cache__nd_opt_tlla: MacAddress | None = option.tlla
-                    break
-            else:
-                self._cache__nd_opt_tlla = None
+            assert self.type in ICMP6_ND_TYPES
+            option = self._find_nd_option(ICMP6_ND_OPT_TLLA)
+            self._cache__nd_opt_tlla: MacAddress | None = (
+                None if option is None else MacAddress(option[2:8])
+            )
         return self._cache__nd_opt_tlla
 
     @property
@@ -467,12 +512,7 @@ class Icmp6Parser:
         be used for address autoconfiguration.
         """
         if "_cache__nd_opt_pi" not in self.__dict__:
-            assert self.type in {
-                ICMP6_ND_ROUTER_SOLICITATION,
-                ICMP6_ND_ROUTER_ADVERTISEMENT,
-                ICMP6_ND_NEIGHBOR_SOLICITATION,
-                ICMP6_ND_NEIGHBOR_ADVERTISEMENT,
-            }
+            assert self.type in ICMP6_ND_TYPES
             self._cache__nd_opt_pi = [
                 _.prefix
                 for _ in self.nd_options
@@ -502,13 +542,15 @@ class Icmp6Parser:
         """
         Check integrity of ICMPv6 ND options.
         """
-        while optr < len(self._frame):
-            if optr + 1 > len(self._frame):
+        frame = self._frame
+        frame_len = len(frame)
+        while optr < frame_len:
+            if optr + 2 > frame_len:
                 return "ICMPv6 sanity check fail - wrong option length (I)"
-            if self._frame[optr + 1] == 0:
+            if not (option_len := frame[optr + 1]):
                 return "ICMPv6 sanity check fail - wrong option length (II)"
-            optr += self._frame[optr + 1] << 3
-            if optr > len(self._frame):
+            optr += option_len << 3
+            if optr > frame_len:
                 return "ICMPv6 sanity check fail - wrong option length (III)"
         return ""
 
@@ -521,67 +563,49 @@ class Icmp6Parser:
         if not config.PACKET_INTEGRITY_CHECK:
             return ""
 
-        if inet_cksum(self._frame[: self._plen], pshdr_sum):
-            return "ICMPv6 integrity - wrong packet checksum"
+        frame = self._frame
+        plen = self._plen
+        frame_len = len(frame)
 
-        if not ICMP6_HEADER_LEN <= self._plen <= len(self):
+        if not ICMP6_HEADER_LEN <= plen <= frame_len:
             return "ICMPv6 integrity - wrong packet length (I)"
 
-        if self._frame[0] == ICMP6_UNREACHABLE:
-            if not 12 <= self._plen <= len(self):
-                return "ICMPv6 integrity - wrong packet length (II)"
-
-        elif self._frame[0] in {ICMP6_ECHO_REQUEST, ICMP6_ECHO_REPLY}:
-            if not 8 <= self._plen <= len(self):
-                return "ICMPv6 integrity - wrong packet length (II)"
+        icmp6_type = frame[0]
 
-        elif self._frame[0] == ICMP6_MLD2_QUERY:
-            if not 28 <= self._plen <= len(self):
-                return "ICMPv6 integrity - wrong packet length (II)"
-            if (
-                self._plen
-                != 28 + struct.unpack("!H", self._frame[26:28])[0] * 16
-            ):
-                return "ICMPv6 integrity - wrong packet length (III)"
-
-        elif self._frame[0] == ICMP6_ND_ROUTER_SOLICITATION:
-            if not 8 <= self._plen <= len(self):
+        if (min_len := ICMP6_PACKET_MIN_LEN[icmp6_type]) is not None:
+            if not min_len <= plen <= frame_len:
                 return "ICMPv6 integrity - wrong packet length (II)"
-            if fail := self._nd_option_integrity_check(8):
-                return fail
 
-        elif self._frame[0] == ICMP6_ND_ROUTER_ADVERTISEMENT:
-            if not 16 <= self._plen <= len(self):
-                return "ICMPv6 integrity - wrong packet length (II)"
-            if fail := self._nd_option_integrity_check(16):
-                return fail
+            if icmp6_type in ICMP6_ND_OPTIONS_OFFSET:
+                if error := self._nd_option_integrity_check(min_len):
+                    return error
 
-        elif self._frame[0] == ICMP6_ND_NEIGHBOR_SOLICITATION:
-            if not 24 <= self._plen <= len(self):
-                return "ICMPv6 integrity - wrong packet length (II)"
-            if fail := self._nd_option_integrity_check(24):
-                return fail
-
-        elif self._frame[0] == ICMP6_ND_NEIGHBOR_ADVERTISEMENT:
-            if not 24 <= self._plen <= len(self):
-                return "ICMPv6 integrity - wrong packet length (II)"
-            if fail := self._nd_option_integrity_check(24):
-                return fail
-
-        elif self._frame[0] == ICMP6_MLD2_REPORT:
-            if not 8 <= self._plen <= len(self):
-                return "ICMPv6 integrity - wrong packet length (II)"
-            optr = 8
-            for _ in range(struct.unpack("!H", self._frame[6:8])[0]):
-                if optr + 20 > self._plen:
+            elif icmp6_type == ICMP6_MLD2_QUERY:
+                if (
+                    plen
+                    != 28 + ICMP6_U16_STRUCT.unpack_from(frame, 26)[0] * 16
+                ):
                     return "ICMPv6 integrity - wrong packet length (III)"
-                optr += (
-                    20
-                    + self._frame[optr + 1]
-                    + struct.unpack_from("! H", self._frame, optr + 2)[0] * 16
-                )
-            if optr != self._plen:
-                return "ICMPv6 integrity - wrong packet length (IV)"
+
+            elif icmp6_type == ICMP6_MLD2_REPORT:
+                record_unpack = ICMP6_MLD2_RECORD_STRUCT.unpack_from
+                optr = 8
+                for _ in range(ICMP6_U16_STRUCT.unpack_from(frame, 6)[0]):
+                    if optr + 20 > plen:
+                        return "ICMPv6 integrity - wrong packet length (III)"
+                    _, aux_data_len, number_of_sources = record_unpack(
+                        frame, optr
+                    )
+                    optr += 20 + aux_data_len + number_of_sources * 16
+                if optr != plen:
+                    return "ICMPv6 integrity - wrong packet length (IV)"
+
+        # Checksum goes last so malformed packets are rejected before
+        # paying for a full pass over the payload.
+        if config.PACKET_CHECKSUM_CHECK and inet_cksum(
+            frame[:plen], pshdr_sum
+        ):
+            return "ICMPv6 integrity - wrong packet checksum"
 
         return ""
 
@@ -596,120 +620,208 @@ class Icmp6Parser:
         if not config.PACKET_SANITY_CHECK:
             return ""
 
-        if self.type == ICMP6_UNREACHABLE:
-            if self.code not in {0, 1, 2, 3, 4, 5, 6}:
-                return "ICMPv6 sanity - 'code' must be [0-6] (RFC 4861)"
-
-        elif self.type == ICMP6_PACKET_TOO_BIG:
-            if not self.code == 0:
-                return "ICMPv6 sanity - 'code' should be 0 (RFC 4861)"
-
-        elif self.type == ICMP6_TIME_EXCEEDED:
-            if self.code not in {0, 1}:
-                return "ICMPv6 sanity - 'code' must be [0-1] (RFC 4861)"
-
-        elif self.type == ICMP6_PARAMETER_PROBLEM:
-            if self.code not in {0, 1, 2}:
-                return "ICMPv6 sanity - 'code' must be [0-2] (RFC 4861)"
-
-        elif self.type in {ICMP6_ECHO_REQUEST, ICMP6_ECHO_REPLY}:
-            if not self.code == 0:
-                return "ICMPv6 sanity - 'code' should be 0 (RFC 4861)"
-
-        elif self.type == ICMP6_MLD2_QUERY:
-            if not self.code == 0:
-                return "ICMPv6 sanity - 'code' must be 0 (RFC 3810)"
-            if not ip6_hop == 1:
-                return "ICMPv6 sanity - 'hop' must be 255 (RFC 3810)"
-
-        elif self.type == ICMP6_ND_ROUTER_SOLICITATION:
-            if not self.code == 0:
-                return "ICMPv6 sanity - 'code' must be 0 (RFC 4861)"
-            if not ip6_hop == 255:
-                return "ICMPv6 sanity - 'hop' must be 255 (RFC 4861)"
-            if not (ip6_src.is_unicast or ip6_src.is_unspecified):
-                return (
-                    "ICMPv6 sanity - 'src' must be unicast or unspecified "
-                    "(RFC 4861)"
-                )
-            if not ip6_dst == Ip6Address("ff02::2"):
-                return "ICMPv6 sanity - 'dst' must be all-routers (RFC 4861)"
-            if ip6_src.is_unspecified and self.nd_opt_slla:
-                return (
-                    "ICMPv6 sanity - 'nd_opt_slla' must not be included if "
-                    "'src' is unspecified (RFC 4861)"
-                )
-
-        elif self.type == ICMP6_ND_ROUTER_ADVERTISEMENT:
-            if not self.code == 0:
-                return "ICMPv6 sanity - 'code' must be 0 (RFC 4861)"
-            if not ip6_hop == 255:
-                return "ICMPv6 sanity - 'hop' must be 255 (RFC 4861)"
-            if not ip6_src.is_link_local:
-                return "ICMPv6 sanity - 'src' must be link local (RFC 4861)"
-            if not (ip6_dst.is_unicast or ip6_dst == Ip6Address("ff02::1")):
-                return (
-                    "ICMPv6 sanity - 'dst' must be unicast or all-nodes "
-                    "(RFC 4861)"
-                )
-
-        elif self.type == ICMP6_ND_NEIGHBOR_SOLICITATION:
-            if not self.code == 0:
-                return "ICMPv6 sanity - 'code' must be 0 (RFC 4861)"
-            if not ip6_hop == 255:
-                return "ICMPv6 sanity - 'hop' must be 255 (RFC 4861)"
-            if not (ip6_src.is_unicast or ip6_src.is_unspecified):
-                return (
-                    "ICMPv6 sanity - 'src' must be unicast or unspecified "
-                    "(RFC 4861)"
-                )
-            if ip6_dst not in {
-                self.ns_target_address,
-                self.ns_target_address.solicited_node_multicast,
-            }:
-                return (
-                    "ICMPv6 sanity - 'dst' must be 'ns_target_address' or it's "
-                    "solicited-node multicast (RFC 4861)"
-                )
-            if not self.ns_target_address.is_unicast:
-                return (
-                    "ICMPv6 sanity - 'ns_target_address' must be unicast "
-                    "(RFC 4861)"
-                )
-            if ip6_src.is_unspecified and self.nd_opt_slla is not None:
-                return (
-                    "ICMPv6 sanity - 'nd_opt_slla' must not be included if "
-                    "'src' is unspecified"
-                )
-
-        elif self.type == ICMP6_ND_NEIGHBOR_ADVERTISEMENT:
-            if not self.code == 0:
-                return "ICMPv6 sanity - 'code' must be 0 (RFC 4861)"
-            if not ip6_hop == 255:
-                return "ICMPv6 sanity - 'hop' must be 255 (RFC 4861)"
-            if not ip6_src.is_unicast:
-                return "ICMPv6 sanity - 'src' must be unicast (RFC 4861)"
-            if self.na_flag_s is True and not (
-                ip6_dst.is_unicast or ip6_dst == Ip6Address("ff02::1")
-            ):
-                return (
-                    "ICMPv6 sanity - if 'na_flag_s' is set then 'dst' must be "
-                    "unicast or all-nodes (RFC 4861)"
-                )
-            if self.na_flag_s is False and not ip6_dst == Ip6Address("ff02::1"):
-                return (
-                    "ICMPv6 sanity - if 'na_flag_s' is not set then 'dst' must "
-                    "be all-nodes (RFC 4861)"
-                )
-
-        elif self.type == ICMP6_MLD2_REPORT:
-            if not self.code == 0:
-                return "ICMPv6 sanity - 'code' must be 0 (RFC 3810)"
-            if not ip6_hop == 1:
-                return "ICMPv6 sanity - 'hop' must be 1 (RFC 3810)"
+        if (sanity_check := ICMP6_SANITY_CHECKS[self.type]) is None:
+            return ""
+
+        return sanity_check(self, ip6_src, ip6_dst, ip6_hop)
+
+    def _unreachable_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the Unreachable message.
+        """
+        if self.code not in {0, 1, 2, 3, 4, 5, 6}:
+            return "ICMPv6 sanity - 'code' must be [0-6] (RFC 4861)"
+        return ""
+
+    def _packet_too_big_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the Packet Too Big message.
+        """
+        if not self.code == 0:
+            return "ICMPv6 sanity - 'code' should be 0 (RFC 4861)"
+        return ""
+
+    def _time_exceeded_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the Time Exceeded message.
+        """
+        if self.code not in {0, 1}:
+            return "ICMPv6 sanity - 'code' must be [0-1] (RFC 4861)"
+        return ""
+
+    def _parameter_problem_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the Parameter Problem message.
+        """
+        if self.code not in {0, 1, 2}:
+            return "ICMPv6 sanity - 'code' must be [0-2] (RFC 4861)"
+        return ""
+
+    def _echo_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the Echo Request / Reply message.
+        """
+        if not self.code == 0:
+            return "ICMPv6 sanity - 'code' should be 0 (RFC 4861)"
+        return ""
+
+    def _mld2_query_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the MLDv2 Query message.
+        """
+        if not self.code == 0:
+            return "ICMPv6 sanity - 'code' must be 0 (RFC 3810)"
+        if not ip6_hop == 1:
+            return "ICMPv6 sanity - 'hop' must be 255 (RFC 3810)"
+        return ""
 
+    def _nd_rs_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the ND Router Solicitation message.
+        """
+        if not self.code == 0:
+            return "ICMPv6 sanity - 'code' must be 0 (RFC 4861)"
+        if not ip6_hop == 255:
+            return "ICMPv6 sanity - 'hop' must be 255 (RFC 4861)"
+        if not (ip6_src.is_unicast or ip6_src.is_unspecified):
+            return (
+                "ICMPv6 sanity - 'src' must be unicast or unspecified "
+                "(RFC 4861)"
+            )
+        if not ip6_dst == IP6_ALL_ROUTERS:
+            return "ICMPv6 sanity - 'dst' must be all-routers (RFC 4861)"
+        if ip6_src.is_unspecified and self.nd_opt_slla:
+            return (
+                "ICMPv6 sanity - 'nd_opt_slla' must not be included if "
+                "'src' is unspecified (RFC 4861)"
+            )
         return ""
 
+    def _nd_ra_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the ND Router Advertisement message.
+        """
+        if not self.code == 0:
+            return "ICMPv6 sanity - 'code' must be 0 (RFC 4861)"
+        if not ip6_hop == 255:
+            return "ICMPv6 sanity - 'hop' must be 255 (RFC 4861)"
+        if not ip6_src.is_link_local:
+            return "ICMPv6 sanity - 'src' must be link local (RFC 4861)"
+        if not (ip6_dst.is_unicast or ip6_dst == IP6_ALL_NODES):
+            return (
+                "ICMPv6 sanity - 'dst' must be unicast or all-nodes "
+                "(RFC 4861)"
+            )
+        return ""
+
+    def _nd_ns_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the ND Neighbor Solicitation message.
+        """
+        if not self.code == 0:
+            return "ICMPv6 sanity - 'code' must be 0 (RFC 4861)"
+        if not ip6_hop == 255:
+            return "ICMPv6 sanity - 'hop' must be 255 (RFC 4861)"
+        if not (ip6_src.is_unicast or ip6_src.is_unspecified):
+            return (
+                "ICMPv6 sanity - 'src' must be unicast or unspecified "
+                "(RFC 4861)"
+            )
+        if ip6_dst not in {
+            self.ns_target_address,
+            self.ns_target_address.solicited_node_multicast,
+        }:
+            return (
+                "ICMPv6 sanity - 'dst' must be 'ns_target_address' or it's "
+                "solicited-node multicast (RFC 4861)"
+            )
+        if not self.ns_target_address.is_unicast:
+            return (
+                "ICMPv6 sanity - 'ns_target_address' must be unicast "
+                "(RFC 4861)"
+            )
+        if ip6_src.is_unspecified and self.nd_opt_slla is not None:
+            return (
+                "ICMPv6 sanity - 'nd_opt_slla' must not be included if "
+                "'src' is unspecified"
+            )
+        return ""
+
+    def _nd_na_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the ND Neighbor Advertisement message.
+        """
+        if not self.code == 0:
+            return "ICMPv6 sanity - 'code' must be 0 (RFC 4861)"
+        if not ip6_hop == 255:
+            return "ICMPv6 sanity - 'hop' must be 255 (RFC 4861)"
+        if not ip6_src.is_unicast:
+            return "ICMPv6 sanity - 'src' must be unicast (RFC 4861)"
+        if self.na_flag_s is True and not (
+            ip6_dst.is_unicast or ip6_dst == IP6_ALL_NODES
+        ):
+            return (
+                "ICMPv6 sanity - if 'na_flag_s' is set then 'dst' must be "
+                "unicast or all-nodes (RFC 4861)"
+            )
+        if self.na_flag_s is False and not ip6_dst == IP6_ALL_NODES:
+            return (
+                "ICMPv6 sanity - if 'na_flag_s' is not set then 'dst' must "
+                "be all-nodes (RFC 4861)"
+            )
+        return ""
+
+    def _mld2_report_sanity_check(
+        self, ip6_src: Ip6Address, ip6_dst: Ip6Address, ip6_hop: int
+    ) -> str:
+        """
+        Sanity check for the MLDv2 Report message.
+        """
+        if not self.code == 0:
+            return "ICMPv6 sanity - 'code' must be 0 (RFC 3810)"
+        if not ip6_hop == 1:
+            return "ICMPv6 sanity - 'hop' must be 1 (RFC 3810)"
+        return ""
+
+
+ICMP6_SANITY_CHECKS = tuple(
+    {
+        ICMP6_UNREACHABLE: Icmp6Parser._unreachable_sanity_check,
+        ICMP6_PACKET_TOO_BIG: Icmp6Parser._packet_too_big_sanity_check,
+        ICMP6_TIME_EXCEEDED: Icmp6Parser._time_exceeded_sanity_check,
+        ICMP6_PARAMETER_PROBLEM: Icmp6Parser._parameter_problem_sanity_check,
+        ICMP6_ECHO_REQUEST: Icmp6Parser._echo_sanity_check,
+        ICMP6_ECHO_REPLY: Icmp6Parser._echo_sanity_check,
+        ICMP6_MLD2_QUERY: Icmp6Parser._mld2_query_sanity_check,
+        ICMP6_ND_ROUTER_SOLICITATION: Icmp6Parser._nd_rs_sanity_check,
+        ICMP6_ND_ROUTER_ADVERTISEMENT: Icmp6Parser._nd_ra_sanity_check,
+        ICMP6_ND_NEIGHBOR_SOLICITATION: Icmp6Parser._nd_ns_sanity_check,
+        ICMP6_ND_NEIGHBOR_ADVERTISEMENT: Icmp6Parser._nd_na_sanity_check,
+        ICMP6_MLD2_REPORT: Icmp6Parser._mld2_report_sanity_check,
+    }.get(icmp6_type)
+    for icmp6_type in range(256)
+)
+
 
 #
 #   ICMPv6 Neighbor Discovery options
@@ -721,7 +833,7 @@ class Icmp6NdOptSLLA:
     ICMPv6 ND option - Source Link Layer Address (1).
     """
 
-    def __init__(self, frame: bytes) -> None:
+    def __init__(self, frame: bytes | memoryview) -> None:
         """
         Option constructor.
         """
@@ -747,7 +859,7 @@ class Icmp6NdOptTLLA:
     ICMPv6 ND option - Target Link Layer Address (2).
     """
 
-    def __init__(self, frame: bytes) -> None:
+    def __init__(self, frame: bytes | memoryview) -> None:
         """
         Option constructor.
         """
@@ -773,7 +885,7 @@ class Icmp6NdOptPI:
     ICMPv6 ND option - Prefix Information (3).
     """
 
-    def __init__(self, frame: bytes) -> None:
+    def __init__(self, frame: bytes | memoryview) -> None:
         """
         Option constructor.
         """
@@ -785,7 +897,12 @@ class Icmp6NdOptPI:
         self.valid_lifetime = struct.unpack_from("!L", frame, 4)[0]
         self.preferr_lifetime = struct.unpack_from("!L", frame, 8)[0]
         self.prefix = Ip6Network(
-            (Ip6Address(frame[16:32]), Ip6Mask(f"/{frame[2]}"))
+            (
+                Ip6Address(frame[16:32]),
+                ICMP6_ND_OPT_PI_MASKS[frame[2]]
+                if frame[2] <= 128
+                else Ip6Mask(f"/{frame[2]}"),
+            )
         )
 
     def __str__(self) -> str:
@@ -806,7 +923,7 @@ class Icmp6NdOptUnk:
     ICMPv6 ND option not supported by this stack.
     """
 
-    def __init__(self, frame: bytes) -> None:
+    def __init__(self, frame: bytes | memoryview) -> None:
         """
         Option constructor.
         """
@@ -827,6 +944,15 @@ class Icmp6NdOptUnk:
         return self.len
 
 
+ICMP6_ND_OPT_CLASSES: dict[
+    int, type[Icmp6NdOptSLLA | Icmp6NdOptTLLA | Icmp6NdOptPI]
+] = {
+    ICMP6_ND_OPT_SLLA: Icmp6NdOptSLLA,
+    ICMP6_ND_OPT_TLLA: Icmp6NdOptTLLA,
+    ICMP6_ND_OPT_PI: Icmp6NdOptPI,
+}
+
+
 #
 #   ICMPv6 Multicast support classes
 #
@@ -842,9 +968,11 @@ class MulticastAddressRecord:
         Class constructor.
         """
         self.raw_record = raw_record
-        self.record_type = self.raw_record[0]
-        self.aux_data_len = self.raw_record[1]
-        self.number_of_sources = struct.unpack("!H", self.raw_record[2:4])[0]
+        (
+            self.record_type,
+            self.aux_data_len,
+            self.number_of_sources,
+        ) = ICMP6_MLD2_RECORD_STRUCT.unpack_from(raw_record)
         self.multicast_address = Ip6Address(self.raw_record[4:20])
         self.source_address = [
             Ip6Address(self.raw_record[20 + 16 * _ : 20 + 16 * (_ + 1)])
@@ -76,10 +76,10 @@ def _phtx_icmp6(
     icmp6_type: int,
     icmp6_code: int = 0,
     ip6_hop: int = 64,
-    icmp6_un_data: bytes | None = None,
+    icmp6_un_data: bytes | memoryview | None = None,
     icmp6_ec_id: int | None = None,
     icmp6_ec_seq: int | None = None,
-    icmp6_ec_data: bytes | None = None,
+    icmp6_ec_data: bytes | memoryview | None = None,
     icmp6_ns_target_address: Ip6Address | None = None,
     icmp6_na_flag_r: bool = False,
     icmp6_na_flag_s: bool = False,
@@ -64,12 +64,46 @@ if TYPE_CHECKING:
     from pytcp.protocols.tcp.fpa import TcpAssembler
     from pytcp.protocols.udp.fpa import UdpAssembler
 
+IP4_HEADER_STRUCT = struct.Struct("! BBH HH BBH L L")
+IP4_CKSUM_STRUCT = struct.Struct("! H")
+
+IP4_OPT_EOL_BYTES = struct.pack("!B", IP4_OPT_EOL)
+IP4_OPT_NOP_BYTES = struct.pack("!B", IP4_OPT_NOP)
+
+IP4_ASSEMBLER_PROTOS = frozenset(
+    {
+        IP4_PROTO_ICMP4,
+        IP4_PROTO_UDP,
+        IP4_PROTO_TCP,
+        IP4_PROTO_RAW,
+    }
+)
+
 
 class Ip4Assembler:
     """
     IPv4 packet assembler support class.
     """
 
+    __slots__ = (
+        "_carried_packet",
+        "_tracker",
+        "_ver",
+        "_dscp",
+        "_ecn",
+        "_id",
+        "_flag_df",
+        "_flag_mf",
+        "_offset",
+        "_ttl",
+        "_src",
+        "_dst",
+        "_options",
+        "_proto",
+        "_hlen",
+        "_plen",
+    )
+
     ether_type = ETHER_TYPE_IP4
 
     def __init__(
@@ -96,12 +130,7 @@ class Ip4Assembler:
         assert 0 <= dscp <= 0x3F
         assert 0 <= ecn <= 0x03
         assert 0 <= id <= 0xFFFF
-        assert carried_packet.ip4_proto in {
-            IP4_PROTO_ICMP4,
-            IP4_PROTO_UDP,
-            IP4_PROTO_TCP,
-            IP4_PROTO_RAW,
-        }
+        assert carried_packet.ip4_proto in IP4_ASSEMBLER_PROTOS
 
         self._carried_packet: Icmp4Assembler | TcpAssembler | UdpAssembler | RawAssembler = (
             carried_packet
@@ -201,15 +230,13 @@ class Ip4Assembler:
         Create IPv4 pseudo header used by TCP and UDP to compute
         their checksums.
         """
-        pseudo_header = struct.pack(
-            "! 4s 4s BBH",
-            bytes(self._src),
-            bytes(self._dst),
-            0,
-            self._proto,
-            self._plen - self._hlen,
+        return (
+            int(self._src)
+            + int(self._dst)
+            + (self._proto << 16)
+            + self._plen
+            - self._hlen
         )
-        return sum(struct.unpack("! 3L", pseudo_header))
 
     @property
     def _raw_options(self) -> bytes:
@@ -222,8 +249,7 @@ class Ip4Assembler:
         """
         Assemble packet into the raw form.
         """
-        struct.pack_into(
-            f"! BBH HH BBH 4s 4s {len(self._raw_options)}s",
+        IP4_HEADER_STRUCT.pack_into(
             frame,
             0,
             self._ver << 4 | self._hlen >> 2,
@@ -234,11 +260,11 @@ class Ip4Assembler:
             self._ttl,
             self._proto,
             0,
-            bytes(self._src),
-            bytes(self._dst),
-            self._raw_options,
+            int(self._src),
+            int(self._dst),
         )
-        struct.pack_into("! H", frame, 10, inet_cksum(frame[: self._hlen]))
+        frame[IP4_HEADER_LEN : self._hlen] = self._raw_options
+        IP4_CKSUM_STRUCT.pack_into(frame, 10, inet_cksum(frame[: self._hlen]))
         self._carried_packet.assemble(frame[self._hlen :], self.pshdr_sum)
 
 
@@ -247,6 +273,25 @@ class Ip4FragAssembler:
     IPv4 packet fragment assembler support class.
     """
 
+    __slots__ = (
+        "_tracker",
+        "_ver",
+        "_dscp",
+        "_ecn",
+        "_id",
+        "_flag_df",
+        "_flag_mf",
+        "_offset",
+        "_ttl",
+        "_src",
+        "_dst",
+        "_options",
+        "_data",
+        "_proto",
+        "_hlen",
+        "_plen",
+    )
+
     ether_type = ETHER_TYPE_IP4
 
     def __init__(
@@ -272,12 +317,7 @@ class Ip4FragAssembler:
         assert 0 <= dscp <= 0x3F
         assert 0 <= ecn <= 0x03
         assert 0 <= id <= 0xFFFF
-        assert proto in {
-            IP4_PROTO_ICMP4,
-            IP4_PROTO_UDP,
-            IP4_PROTO_TCP,
-            IP4_PROTO_RAW,
-        }
+        assert proto in IP4_ASSEMBLER_PROTOS
 
         self._tracker: Tracker = Tracker(prefix="TX")
         self._ver: int = 4
@@ -361,8 +401,7 @@ class Ip4FragAssembler:
         """
         Assemble packet into the raw form.
         """
-        struct.pack_into(
-            f"! BBH HH BBH 4s 4s {len(self._raw_options)}s {len(self._data)}s",
+        IP4_HEADER_STRUCT.pack_into(
             frame,
             0,
             self._ver << 4 | self._hlen >> 2,
@@ -373,12 +412,12 @@ class Ip4FragAssembler:
             self._ttl,
             self._proto,
             0,
-            bytes(self._src),
-            bytes(self._dst),
-            bytes(self._raw_options),  # memoryview: conversion to bytes require
-            bytes(self._data),  # memoryview: conversion to bytes require
+            int(self._src),
+            int(self._dst),
         )
-        struct.pack_into("! H", frame, 10, inet_cksum(frame[: self._hlen]))
+        frame[IP4_HEADER_LEN : self._hlen] = self._raw_options
+        frame[self._hlen : self._plen] = self._data
+        IP4_CKSUM_STRUCT.pack_into(frame, 10, inet_cksum(frame[: self._hlen]))
 
 
 #
@@ -413,7 +452,7 @@ class Ip4OptEol:
         """
         Get option in raw form.
         """
-        return struct.pack("!B", IP4_OPT_EOL)
+        return IP4_OPT_EOL_BYTES
 
     def __eq__(self, other: object) -> bool:
         """
@@ -449,7 +488,7 @@ class Ip4OptNop:
         """
         Get option in raw form.
         """
-        return struct.pack("!B", IP4_OPT_NOP)
+        return IP4_OPT_NOP_BYTES
 
     def __eq__(self, other: object) -> bool:
         """
@@ -40,6 +40,7 @@ ver 2.7
 
 from __future__ import annotations
 
+import functools
 import struct
 from typing import TYPE_CHECKING
 
@@ -58,6 +59,19 @@ from pytcp.protocols.ip4.ps import (
 if TYPE_CHECKING:
     from pytcp.lib.packet import PacketRx
 
+IP4_U16_STRUCT = struct.Struct("!H")
+IP4_U32_STRUCT = struct.Struct("!L")
+IP4_SRC_DST_STRUCT = struct.Struct("!LL")
+
+
+@functools.lru_cache(maxsize=1024)
+def _ip4_address(address: int) -> Ip4Address:
+    """
+    Return shared 'Ip4Address' object for the given address, the same
+    few peer addresses repeat in most of the received packets.
+    """
+    return Ip4Address(address)
+
 
 class Ip4Parser:
     """
@@ -105,7 +119,7 @@ class Ip4Parser:
         Read the 'Version' field.
         """
         if "_cache__ver" not in self.__dict__:
-            self._cache__ver = self._frame[0] >> 4
+            self._read_first_word()
         return self._cache__ver
 
     @property
@@ -114,7 +128,7 @@ class Ip4Parser:
         Read the 'Header length' field.
         """
         if "_cache__hlen" not in self.__dict__:
-            self._cache__hlen = (self._frame[0] & 0b00001111) << 2
+            self._read_first_word()
         return self._cache__hlen
 
     @property
@@ -123,7 +137,7 @@ class Ip4Parser:
         Read the 'DSCP' field.
         """
         if "_cache__dscp" not in self.__dict__:
-            self._cache__dscp = (self._frame[1] & 0b11111100) >> 2
+            self._read_first_word()
         return self._cache__dscp
 
     @property
@@ -132,7 +146,7 @@ class Ip4Parser:
         Read the 'ECN' field.
         """
         if "_cache__ecn" not in self.__dict__:
-            self._cache__ecn = self._frame[1] & 0b00000011
+            self._read_first_word()
         return self._cache__ecn
 
     @property
@@ -141,16 +155,28 @@ class Ip4Parser:
         Read the 'Packet length' field.
         """
         if "_cache__plen" not in self.__dict__:
-            self._cache__plen: int = struct.unpack("!H", self._frame[2:4])[0]
+            self._read_first_word()
         return self._cache__plen
 
+    def _read_first_word(self) -> None:
+        """
+        Read the 'Version', 'Header length', 'DSCP', 'ECN' and
+        'Packet length' fields with a single unpack.
+        """
+        word: int = IP4_U32_STRUCT.unpack_from(self._frame)[0]
+        self._cache__ver = word >> 28
+        self._cache__hlen = (word >> 22) & 0b00111100
+        self._cache__dscp = (word >> 18) & 0b00111111
+        self._cache__ecn = (word >> 16) & 0b00000011
+        self._cache__plen = word & 0xFFFF
+
     @property
     def id(self) -> int:
         """
         Read the 'Identification' field.
         """
         if "_cache__id" not in self.__dict__:
-            self._cache__id: int = struct.unpack("!H", self._frame[4:6])[0]
+            self._cache__id: int = IP4_U16_STRUCT.unpack_from(self._frame, 4)[0]
         return self._cache__id
 
     @property
@@ -158,14 +184,18 @@ class Ip4Parser:
         """
         Read the 'DF flag' field.
         """
-        return bool(self._frame[6] & 0b01000000)
+        if "_cache__flag_df" not in self.__dict__:
+            self._read_flags_offset()
+        return self._cache__flag_df
 
     @property
     def flag_mf(self) -> bool:
         """
         Read the 'MF flag' field.
         """
-        return bool(self._frame[6] & 0b00100000)
+        if "_cache__flag_mf" not in self.__dict__:
+            self._read_flags_offset()
+        return self._cache__flag_mf
 
     @property
     def offset(self) -> int:
@@ -173,11 +203,19 @@ class Ip4Parser:
         Read the 'Fragment offset' field.
         """
         if "_cache__offset" not in self.__dict__:
-            self._cache__offset: int = (
-                struct.unpack("!H", self._frame[6:8])[0] & 0b0001111111111111
-            ) << 3
+            self._read_flags_offset()
         return self._cache__offset
 
+    def _read_flags_offset(self) -> None:
+        """
+        Read the 'DF flag', 'MF flag' and 'Fragment offset' fields
+        with a single unpack.
+        """
+        flags_offset: int = IP4_U16_STRUCT.unpack_from(self._frame, 6)[0]
+        self._cache__flag_df = bool(flags_offset & 0b0100000000000000)
+        self._cache__flag_mf = bool(flags_offset & 0b0010000000000000)
+        self._cache__offset = (flags_offset & 0b0001111111111111) << 3
+
     @property
     def ttl(self) -> int:
         """
@@ -198,7 +236,9 @@ class Ip4Parser:
         Read the 'Checksum' field.
         """
         if "_cache__cksum" not in self.__dict__:
-            self._cache__cksum: int = struct.unpack("!H", self._frame[10:12])[0]
+            self._cache__cksum: int = IP4_U16_STRUCT.unpack_from(
+                self._frame, 10
+            )[0]
         return self._cache__cksum
 
     @property
@@ -207,7 +247,9 @@ class Ip4Parser:
         Read the 'Source address' field.
         """
         if "_cache__src" not in self.__dict__:
-            self._cache__src = Ip4Address(self._frame[12:16])
+            self._cache__src = _ip4_address(
+                IP4_U32_STRUCT.unpack_from(self._frame, 12)[0]
+            )
         return self._cache__src
 
     @property
@@ -216,7 +258,9 @@ class Ip4Parser:
         Read the 'Destination address' field.
         """
         if "_cache__dst" not in self.__dict__:
-            self._cache__dst = Ip4Address(self._frame[16:20])
+            self._cache__dst = _ip4_address(
+                IP4_U32_STRUCT.unpack_from(self._frame, 16)[0]
+            )
         return self._cache__dst
 
     @property
@@ -231,10 +275,10 @@ class Ip4Parser:
 
             while optr < self.hlen:
                 if self._frame[optr] == IP4_OPT_EOL:
-                    self._cache__options.append(Ip4OptEol())
+                    self._cache__options.append(IP4_OPT_EOL_SINGLETON)
                     break
                 if self._frame[optr] == IP4_OPT_NOP:
-                    self._cache__options.append(Ip4OptNop())
+                    self._cache__options.append(IP4_OPT_NOP_SINGLETON)
                     optr += IP4_OPT_NOP_LEN
                     continue
                 # typing: Had to put single mapping (0: lambda _: None)
@@ -266,6 +310,15 @@ class Ip4Parser:
             self._cache__dlen = self.plen - self.hlen
         return self._cache__dlen
 
+    @property
+    def data(self) -> memoryview:
+        """
+        Read the data packet carries.
+        """
+        if "_cache__data" not in self.__dict__:
+            self._cache__data = self._frame[self.hlen : self.plen]
+        return self._cache__data
+
     @property
     def header_copy(self) -> bytes:
         """
@@ -310,17 +363,12 @@ class Ip4Parser:
         Create IPv4 pseudo header used by TCP and UDP to compute
         their checksums.
         """
-        if "_cache.__pshdr_sum" not in self.__dict__:
-            pseudo_header = struct.pack(
-                "! 4s 4s BBH",
-                bytes(self.src),
-                bytes(self.dst),
-                0,
-                self.proto,
-                self.plen - self.hlen,
-            )
-            self._cache__pshdr_sum = int(
-                sum(struct.unpack("! 3L", pseudo_header))
+        if "_cache__pshdr_sum" not in self.__dict__:
+            self._cache__pshdr_sum: int = (
+                sum(IP4_SRC_DST_STRUCT.unpack_from(self._frame, 12))
+                + (self.proto << 16)
+                + self.plen
+                - self.hlen
             )
         return self._cache__pshdr_sum
 
@@ -341,7 +389,9 @@ class Ip4Parser:
 
         # Cannot compute checksum earlier because it depends
         # on sanity of hlen field
-        if inet_cksum(self._frame[: self.hlen]):
+        if config.PACKET_CHECKSUM_CHECK and inet_cksum(
+            self._frame[: self.hlen]
+        ):
             return "IPv4 integriy - wrong packet checksum"
 
         optr = IP4_HEADER_LEN
@@ -458,3 +508,8 @@ class Ip4OptUnk:
         """Option length"""
 
         return self.len
+
+
+# Stateless options are shared between all parsed packets
+IP4_OPT_EOL_SINGLETON = Ip4OptEol()
+IP4_OPT_NOP_SINGLETON = Ip4OptNop()
@@ -37,7 +37,6 @@ ver 2.7
 
 from __future__ import annotations
 
-import struct
 from time import time
 from typing import TYPE_CHECKING
 
@@ -45,7 +44,7 @@ from pytcp import config
 from pytcp.lib.ip_helper import inet_cksum
 from pytcp.lib.logger import log
 from pytcp.lib.packet import PacketRx
-from pytcp.protocols.ip4.fpp import Ip4Parser
+from pytcp.protocols.ip4.fpp import IP4_U16_STRUCT, Ip4Parser
 from pytcp.protocols.ip4.ps import (
     IP4_HEADER_LEN,
     IP4_PROTO_ICMP4,
@@ -64,13 +63,16 @@ def _defragment_ip4_packet(
     Defragment IPv4 packet.
     """
 
-    # Cleanup expired flows
-    self.ip4_frag_flows = {
-        _: self.ip4_frag_flows[_]
-        for _ in self.ip4_frag_flows
-        if self.ip4_frag_flows[_]["timestamp"] - time()
-        < config.IP4_FRAG_FLOW_TIMEOUT
-    }
+    # Cleanup expired flows, at most once per second
+    now = time()
+    if now - self.ip4_frag_flows_last_gc > 1.0:
+        self.ip4_frag_flows_last_gc = now
+        for expired_flow_id in [
+            _
+            for _, flow in self.ip4_frag_flows.items()
+            if now - flow["timestamp"] >= config.IP4_FRAG_FLOW_TIMEOUT
+        ]:
+            del self.ip4_frag_flows[expired_flow_id]
 
     __debug__ and log(
         "ip4",
@@ -81,51 +83,81 @@ def _defragment_ip4_packet(
 
     flow_id = (packet_rx.ip4.src, packet_rx.ip4.dst, packet_rx.ip4.id)
 
-    # Update flow db
-    if flow_id in self.ip4_frag_flows:
-        self.ip4_frag_flows[flow_id]["data"][
-            packet_rx.ip4.offset
-        ] = packet_rx.ip4.data_copy
-    else:
-        self.ip4_frag_flows[flow_id] = {
-            "header": packet_rx.ip4.header_copy,
-            "timestamp": time(),
-            "last": False,
-            "data": {packet_rx.ip4.offset: packet_rx.ip4.data_copy},
+    offset = packet_rx.ip4.offset
+    end = offset + packet_rx.ip4.dlen
+
+    # Update flow db, 'covered' is the length of data received contiguously
+    # from offset zero and 'pending' holds the end of fragments received
+    # past it, keyed by offset so the duplicates overwrite each other
+    if (flow := self.ip4_frag_flows.get(flow_id)) is None:
+        if len(self.ip4_frag_flows) >= config.IP4_FRAG_FLOW_LIMIT:
+            self.ip4_frag_flows.popitem(last=False)
+        flow = self.ip4_frag_flows[flow_id] = {
+            "timestamp": now,
+            "last_end": None,
+            "covered": 0,
+            "pending": {},
+            "frame": bytearray(packet_rx.ip4.header_copy),
         }
+    else:
+        self.ip4_frag_flows.move_to_end(flow_id)
+    covered = flow["covered"]
+    pending = flow["pending"]
+    if offset > covered:
+        if (
+            offset not in pending
+            and len(pending) >= config.IP4_FRAG_FLOW_FRAG_LIMIT
+        ):
+            del self.ip4_frag_flows[flow_id]
+            __debug__ and log(
+                "ip4",
+                f"{packet_rx.tracker} - <WARN>IPv4 fragment flow exceeds "
+                f"{config.IP4_FRAG_FLOW_FRAG_LIMIT} fragments, dropping</>",
+            )
+            return None
+        pending[offset] = max(end, pending.get(offset, end))
+    elif end > covered:
+        covered = end
+        while merged := [_ for _ in pending if _ <= covered]:
+            for merged_offset in merged:
+                covered = max(covered, pending.pop(merged_offset))
+        flow["covered"] = covered
     if not packet_rx.ip4.flag_mf:
-        self.ip4_frag_flows[flow_id]["last"] = True
+        flow["last_end"] = end
+
+    # Fragment data is copied straight into the flow buffer that becomes
+    # the frame of defragmented packet
+    frame = flow["frame"]
+    if len(frame) < IP4_HEADER_LEN + end:
+        frame.extend(bytes(IP4_HEADER_LEN + end - len(frame)))
+    frame[IP4_HEADER_LEN + offset : IP4_HEADER_LEN + end] = packet_rx.ip4.data
 
     # Test if we received all fragments
-    if not self.ip4_frag_flows[flow_id]["last"]:
+    if (data_len := flow["last_end"]) is None or covered < data_len:
         return None
-    data_len = 0
-    for offset in sorted(self.ip4_frag_flows[flow_id]["data"]):
-        if offset > data_len:
-            return None
-        data_len = offset + len(self.ip4_frag_flows[flow_id]["data"][offset])
-
-    # Defragment packet
-    header = bytearray(self.ip4_frag_flows[flow_id]["header"])
-    data = bytearray(data_len)
-    for offset in sorted(self.ip4_frag_flows[flow_id]["data"]):
-        struct.pack_into(
-            f"{len(self.ip4_frag_flows[flow_id]['data'][offset])}s",
-            data,
-            offset,
-            self.ip4_frag_flows[flow_id]["data"][offset],
-        )
+
+    # Defragment packet, unless it would not fit into IPv4 packet length
     del self.ip4_frag_flows[flow_id]
-    header[0] = 0x45
-    struct.pack_into("!H", header, 2, IP4_HEADER_LEN + len(data))
-    header[6] = header[7] = header[10] = header[11] = 0
-    struct.pack_into("!H", header, 10, inet_cksum(memoryview(header)))
-    packet_rx = PacketRx(bytes(header) + data)
+    if IP4_HEADER_LEN + data_len > 0xFFFF:
+        __debug__ and log(
+            "ip4",
+            f"{packet_rx.tracker} - <WARN>Reasembled IPv4 packet too long, "
+            f"dlen {data_len} bytes, dropping</>",
+        )
+        return None
+    del frame[IP4_HEADER_LEN + data_len :]
+    frame[0] = 0x45
+    IP4_U16_STRUCT.pack_into(frame, 2, IP4_HEADER_LEN + data_len)
+    frame[6] = frame[7] = frame[10] = frame[11] = 0
+    IP4_U16_STRUCT.pack_into(
+        frame, 10, inet_cksum(memoryview(frame)[:IP4_HEADER_LEN])
+    )
+    packet_rx = PacketRx(frame)
     Ip4Parser(packet_rx)
     __debug__ and log(
         "ip4",
         f"{packet_rx.tracker} - Reasembled fragmented IPv4 packet, "
-        f"dlen {len(data)} bytes",
+        f"dlen {data_len} bytes",
     )
     return packet_rx
 
@@ -147,10 +179,12 @@ def _phrx_ip4(self: PacketHandler, packet_rx: PacketRx) -> None:
 
     __debug__ and log("ip4", f"{packet_rx.tracker} - {packet_rx.ip4}")
 
+    dst = packet_rx.ip4.dst
+
     # Check if received packet has been sent to us directly or by
     # unicast/broadcast, allow any destination if no unicast address
     # is configured (for DHCP client).
-    if self.ip4_unicast and packet_rx.ip4.dst not in {
+    if self.ip4_unicast and dst not in {
         *self.ip4_unicast,
         *self.ip4_multicast,
         *self.ip4_broadcast,
@@ -163,13 +197,13 @@ def _phrx_ip4(self: PacketHandler, packet_rx: PacketRx) -> None:
         )
         return
 
-    if packet_rx.ip4.dst in self.ip4_unicast:
+    if dst in self.ip4_unicast:
         self.packet_stats_rx.ip4__dst_unicast += 1
 
-    if packet_rx.ip4.dst in self.ip4_multicast:
+    if dst in self.ip4_multicast:
         self.packet_stats_rx.ip4__dst_multicast += 1
 
-    if packet_rx.ip4.dst in self.ip4_broadcast:
+    if dst in self.ip4_broadcast:
         self.packet_stats_rx.ip4__dst_broadcast += 1
 
     # Check if packet is a fragment and if so process it accordingly
@@ -182,14 +216,16 @@ def _phrx_ip4(self: PacketHandler, packet_rx: PacketRx) -> None:
         packet_rx = defragmented_packet_rx
         self.packet_stats_rx.ip4__defrag += 1
 
-    if packet_rx.ip4.proto == IP4_PROTO_ICMP4:
+    proto = packet_rx.ip4.proto
+
+    if proto == IP4_PROTO_ICMP4:
         self._phrx_icmp4(packet_rx)
         return
 
-    if packet_rx.ip4.proto == IP4_PROTO_UDP:
+    if proto == IP4_PROTO_UDP:
         self._phrx_udp(packet_rx)
         return
 
-    if packet_rx.ip4.proto == IP4_PROTO_TCP:
+    if proto == IP4_PROTO_TCP:
         self._phrx_tcp(packet_rx)
         return
@@ -175,17 +175,16 @@ class Ip6Assembler:
         Returns IPv6 pseudo header that is used by TCP, UDP and ICMPv6
         to compute their checksums.
         """
-        pseudo_header = struct.pack(
-            "! 16s 16s L BBBB",
-            bytes(self._src),
-            bytes(self._dst),
-            self._dlen,
-            0,
-            0,
-            0,
-            self._next,
+        src = int(self._src)
+        dst = int(self._dst)
+        return (
+            (src >> 64)
+            + (src & 0xFFFF_FFFF_FFFF_FFFF)
+            + (dst >> 64)
+            + (dst & 0xFFFF_FFFF_FFFF_FFFF)
+            + (self._dlen << 32)
+            + self._next
         )
-        return sum(struct.unpack("! 5Q", pseudo_header))
 
     def assemble(self, frame: memoryview) -> None:
         """
@@ -47,6 +47,8 @@ from pytcp.protocols.ip6.ps import IP6_HEADER_LEN, IP6_NEXT_TABLE
 if TYPE_CHECKING:
     from pytcp.lib.packet import PacketRx
 
+IP6_SRC_DST_STRUCT = struct.Struct("!QQQQ")
+
 
 class Ip6Parser:
     """
@@ -219,18 +221,10 @@ class Ip6Parser:
         to compute their checksums.
         """
         if "_cache__pshdr_sum" not in self.__dict__:
-            pseudo_header = struct.pack(
-                "! 16s 16s L BBBB",
-                bytes(self.src),
-                bytes(self.dst),
-                self.dlen,
-                0,
-                0,
-                0,
-                self.next,
-            )
-            self._cache__pshdr_sum = int(
-                sum(struct.unpack("! 5Q", pseudo_header))
+            self._cache__pshdr_sum: int = (
+                sum(IP6_SRC_DST_STRUCT.unpack_from(self._frame, 8))
+                + (self.dlen << 32)
+                + self.next
             )
 
         return self._cache__pshdr_sum
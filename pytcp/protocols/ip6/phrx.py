@@ -71,9 +71,11 @@ def _phrx_ip6(self: PacketHandler, packet_rx: PacketRx) -> None:
 
     __debug__ and log("ip6", f"{packet_rx.tracker} - {packet_rx.ip6}")
 
+    dst = packet_rx.ip6.dst
+
     # Check if received packet has been sent to us directly or by unicast
     # or multicast
-    if packet_rx.ip6.dst not in {*self.ip6_unicast, *self.ip6_multicast}:
+    if dst not in {*self.ip6_unicast, *self.ip6_multicast}:
         self.packet_stats_rx.ip6__dst_unknown__drop += 1
         __debug__ and log(
             "ip6",
@@ -82,24 +84,26 @@ def _phrx_ip6(self: PacketHandler, packet_rx: PacketRx) -> None:
         )
         return
 
-    if packet_rx.ip6.dst in self.ip6_unicast:
+    if dst in self.ip6_unicast:
         self.packet_stats_rx.ip6__dst_unicast += 1
 
-    if packet_rx.ip6.dst in self.ip6_multicast:
+    if dst in self.ip6_multicast:
         self.packet_stats_rx.ip6__dst_multicast += 1
 
-    if packet_rx.ip6.next == IP6_NEXT_EXT_FRAG:
+    ip6_next = packet_rx.ip6.next
+
+    if ip6_next == IP6_NEXT_EXT_FRAG:
         self._phrx_ip6_ext_frag(packet_rx)
         return
 
-    if packet_rx.ip6.next == IP6_NEXT_ICMP6:
+    if ip6_next == IP6_NEXT_ICMP6:
         self._phrx_icmp6(packet_rx)
         return
 
-    if packet_rx.ip6.next == IP6_NEXT_UDP:
+    if ip6_next == IP6_NEXT_UDP:
         self._phrx_udp(packet_rx)
         return
 
-    if packet_rx.ip6.next == IP6_NEXT_TCP:
+    if ip6_next == IP6_NEXT_TCP:
         self._phrx_tcp(packet_rx)
         return
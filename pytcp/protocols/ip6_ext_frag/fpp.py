@@ -146,6 +146,15 @@ class Ip6ExtFragParser:
         """
         return self._plen
 
+    @property
+    def data(self) -> memoryview:
+        """
+        Read the data packet carries.
+        """
+        if "_cache__data" not in self.__dict__:
+            self._cache__data = self._frame[IP6_EXT_FRAG_HEADER_LEN : self.plen]
+        return self._cache__data
+
     @property
     def header_copy(self) -> bytes:
         """
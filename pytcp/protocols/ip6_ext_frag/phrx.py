@@ -37,13 +37,13 @@ ver 2.7
 
 from __future__ import annotations
 
-import struct
 from time import time
 from typing import TYPE_CHECKING
 
 from pytcp import config
-from pytcp.lib.logger import log
+from pytcp.lib.logger import log, log_enabled
 from pytcp.lib.packet import PacketRx
+from pytcp.protocols.ip6.ps import IP6_HEADER_LEN
 from pytcp.protocols.ip6_ext_frag.fpp import Ip6ExtFragParser
 
 if TYPE_CHECKING:
@@ -57,69 +57,106 @@ def _defragment_ip6_packet(
     Defragment IPv6 packet.
     """
 
-    # Cleanup expir flows
-    self.ip6_frag_flows = {
-        _: self.ip6_frag_flows[_]
-        for _ in self.ip6_frag_flows
-        if self.ip6_frag_flows[_]["timestamp"] - time()
-        < config.IP6_FRAG_FLOW_TIMEOUT
-    }
-
-    __debug__ and log(
-        "ip6",
-        f"{packet_rx.tracker} - IPv6 packet fragment, "
-        f"offset {packet_rx.ip6_ext_frag.offset}, "
-        f"dlen {packet_rx.ip6_ext_frag.dlen}"
-        f"{'' if packet_rx.ip6_ext_frag.flag_mf else ', last'}",
-    )
-
-    flow_id = (packet_rx.ip6.src, packet_rx.ip6.dst, packet_rx.ip6_ext_frag.id)
-
-    # Update flow db
-    if flow_id in self.ip6_frag_flows:
-        self.ip6_frag_flows[flow_id]["data"][
-            packet_rx.ip6_ext_frag.offset
-        ] = packet_rx.ip6_ext_frag.data_copy
-    else:
-        self.ip6_frag_flows[flow_id] = {
-            "header": packet_rx.ip6.header_copy,
-            "timestamp": time(),
-            "last": False,
-            "data": {
-                packet_rx.ip6_ext_frag.offset: packet_rx.ip6_ext_frag.data_copy
-            },
+    ip6_ext_frag = packet_rx.ip6_ext_frag
+    offset = ip6_ext_frag.offset
+    end = offset + ip6_ext_frag.dlen
+    flag_mf = ip6_ext_frag.flag_mf
+    flows = self.ip6_frag_flows
+
+    # Cleanup expired flows, at most once per second
+    now = time()
+    if now - self.ip6_frag_flows_last_gc > 1.0:
+        self.ip6_frag_flows_last_gc = now
+        for expired_flow_id in [
+            _
+            for _, flow in flows.items()
+            if now - flow["timestamp"] >= config.IP6_FRAG_FLOW_TIMEOUT
+        ]:
+            del flows[expired_flow_id]
+
+    if __debug__ and log_enabled("ip6"):
+        log(
+            "ip6",
+            f"{packet_rx.tracker} - IPv6 packet fragment, "
+            f"offset {offset}, dlen {ip6_ext_frag.dlen}"
+            f"{'' if flag_mf else ', last'}",
+        )
+
+    flow_id = (packet_rx.ip6.src, packet_rx.ip6.dst, ip6_ext_frag.id)
+
+    # Update flow db, 'covered' is the length of data received contiguously
+    # from offset zero and 'pending' holds the end of fragments received
+    # past it, keyed by offset so the duplicates overwrite each other
+    if (flow := flows.get(flow_id)) is None:
+        if len(flows) >= config.IP6_FRAG_FLOW_LIMIT:
+            flows.popitem(last=False)
+        flow = flows[flow_id] = {
+            "timestamp": now,
+            "last_end": None,
+            "covered": 0,
+            "pending": {},
+            "frame": bytearray(packet_rx.ip6.header_copy),
         }
-    if not packet_rx.ip6_ext_frag.flag_mf:
-        self.ip6_frag_flows[flow_id]["last"] = True
+    else:
+        flows.move_to_end(flow_id)
+    covered = flow["covered"]
+    pending = flow["pending"]
+    if offset > covered:
+        if (
+            offset not in pending
+            and len(pending) >= config.IP6_FRAG_FLOW_FRAG_LIMIT
+        ):
+            del flows[flow_id]
+            if __debug__ and log_enabled("ip6"):
+                log(
+                    "ip6",
+                    f"{packet_rx.tracker} - <WARN>IPv6 fragment flow exceeds "
+                    f"{config.IP6_FRAG_FLOW_FRAG_LIMIT} fragments, "
+                    "dropping</>",
+                )
+            return None
+        pending[offset] = max(end, pending.get(offset, end))
+    elif end > covered:
+        covered = end
+        while merged := [_ for _ in pending if _ <= covered]:
+            for merged_offset in merged:
+                covered = max(covered, pending.pop(merged_offset))
+        flow["covered"] = covered
+    if not flag_mf:
+        flow["last_end"] = end
+
+    # Fragment data is copied straight into the flow buffer that becomes
+    # the frame of defragmented packet
+    frame = flow["frame"]
+    if len(frame) < IP6_HEADER_LEN + end:
+        frame.extend(bytes(IP6_HEADER_LEN + end - len(frame)))
+    frame[IP6_HEADER_LEN + offset : IP6_HEADER_LEN + end] = ip6_ext_frag.data
 
     # Test if we received all fragments
-    if not self.ip6_frag_flows[flow_id]["last"]:
+    if (data_len := flow["last_end"]) is None or covered < data_len:
         return None
-    data_len = 0
-    for offset in sorted(self.ip6_frag_flows[flow_id]["data"]):
-        if offset > data_len:
-            return None
-        data_len = offset + len(self.ip6_frag_flows[flow_id]["data"][offset])
-
-    # Defragment packet
-    header = bytearray(self.ip6_frag_flows[flow_id]["header"])
-    data = bytearray(data_len)
-    for offset in sorted(self.ip6_frag_flows[flow_id]["data"]):
-        struct.pack_into(
-            f"{len(self.ip6_frag_flows[flow_id]['data'][offset])}s",
-            data,
-            offset,
-            self.ip6_frag_flows[flow_id]["data"][offset],
+
+    # Defragment packet, unless it would not fit into IPv6 payload length
+    del flows[flow_id]
+    if data_len > 0xFFFF:
+        if __debug__ and log_enabled("ip6"):
+            log(
+                "ip6",
+                f"{packet_rx.tracker} - <WARN>Defragmented IPv6 packet too "
+                f"long, dlen {data_len} bytes, dropping</>",
+            )
+        return None
+    del frame[IP6_HEADER_LEN + data_len :]
+    frame[4] = data_len >> 8
+    frame[5] = data_len & 0xFF
+    frame[6] = ip6_ext_frag.next
+    packet_rx = PacketRx(frame)
+    if __debug__ and log_enabled("ip6"):
+        log(
+            "ip6",
+            f"{packet_rx.tracker} - Defragmented IPv6 packet, "
+            f"dlen {data_len} bytes",
         )
-    del self.ip6_frag_flows[flow_id]
-    struct.pack_into("!H", header, 4, len(data))
-    header[6] = packet_rx.ip6_ext_frag.next
-    packet_rx = PacketRx(bytes(header) + data)
-    __debug__ and log(
-        "ip6",
-        f"{packet_rx.tracker} - Defragmented IPv6 packet, "
-        f"dlen {len(data)} bytes",
-    )
     return packet_rx
 
 
@@ -134,13 +171,15 @@ def _phrx_ip6_ext_frag(self: PacketHandler, packet_rx: PacketRx) -> None:
 
     if packet_rx.parse_failed:
         self.packet_stats_rx.ip6_ext_frag__failed_parse += 1
-        __debug__ and log(
-            "ip6",
-            f"{packet_rx.tracker} - <CRIT>{packet_rx.parse_failed}</>",
-        )
+        if __debug__ and log_enabled("ip6"):
+            log(
+                "ip6",
+                f"{packet_rx.tracker} - <CRIT>{packet_rx.parse_failed}</>",
+            )
         return
 
-    __debug__ and log("ip6", f"{packet_rx.tracker} - {packet_rx.ip6_ext_frag}")
+    if __debug__ and log_enabled("ip6"):
+        log("ip6", f"{packet_rx.tracker} - {packet_rx.ip6_ext_frag}")
 
     if defragmented_packet_rx := self._defragment_ip6_packet(packet_rx):
         self.packet_stats_rx.ip6_ext_frag__defrag += 1
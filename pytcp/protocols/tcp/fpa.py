@@ -59,6 +59,17 @@ from pytcp.protocols.tcp.ps import (
     TCP_OPT_WSCALE_LEN,
 )
 
+TCP_CKSUM_STRUCT = struct.Struct("! H")
+TCP_OPT_MSS_STRUCT = struct.Struct("! BB H")
+TCP_OPT_WSCALE_STRUCT = struct.Struct("! BB B")
+TCP_OPT_TIMESTAMP_STRUCT = struct.Struct("! BB LL")
+
+TCP_OPT_EOL_BYTES = struct.pack("! B", TCP_OPT_EOL)
+TCP_OPT_NOP_BYTES = struct.pack("! B", TCP_OPT_NOP)
+TCP_OPT_SACKPERM_BYTES = struct.pack(
+    "! BB", TCP_OPT_SACKPERM, TCP_OPT_SACKPERM_LEN
+)
+
 
 class TcpAssembler:
     """
@@ -208,7 +219,7 @@ class TcpAssembler:
             self._raw_options,
             self._data,
         )
-        struct.pack_into("! H", frame, 16, inet_cksum(frame, pshdr_sum))
+        TCP_CKSUM_STRUCT.pack_into(frame, 16, inet_cksum(frame, pshdr_sum))
 
 
 #
@@ -243,7 +254,7 @@ class TcpOptEol:
         """
         Option in raw form.
         """
-        return struct.pack("!B", TCP_OPT_EOL)
+        return TCP_OPT_EOL_BYTES
 
     def __eq__(self, other: object) -> bool:
         """
@@ -279,7 +290,7 @@ class TcpOptNop:
         """
         Option in raw form.
         """
-        return struct.pack("!B", TCP_OPT_NOP)
+        return TCP_OPT_NOP_BYTES
 
     def __eq__(self, other: object) -> bool:
         """
@@ -322,7 +333,7 @@ class TcpOptMss:
         """
         Option in raw form.
         """
-        return struct.pack("! BB H", TCP_OPT_MSS, TCP_OPT_MSS_LEN, self._mss)
+        return TCP_OPT_MSS_STRUCT.pack(TCP_OPT_MSS, TCP_OPT_MSS_LEN, self._mss)
 
     def __eq__(self, other: object) -> bool:
         """
@@ -365,8 +376,8 @@ class TcpOptWscale:
         """
         Option in raw form.
         """
-        return struct.pack(
-            "! BB B", TCP_OPT_WSCALE, TCP_OPT_WSCALE_LEN, self._wscale
+        return TCP_OPT_WSCALE_STRUCT.pack(
+            TCP_OPT_WSCALE, TCP_OPT_WSCALE_LEN, self._wscale
         )
 
     def __eq__(self, other: object) -> bool:
@@ -403,7 +414,7 @@ class TcpOptSackPerm:
         """
         Option in raw form.
         """
-        return struct.pack("! BB", TCP_OPT_SACKPERM, TCP_OPT_SACKPERM_LEN)
+        return TCP_OPT_SACKPERM_BYTES
 
     def __eq__(self, other: object) -> bool:
         """
@@ -448,8 +459,7 @@ class TcpOptTimestamp:
         """
         Option in raw form.
         """
-        return struct.pack(
-            "! BB LL",
+        return TCP_OPT_TIMESTAMP_STRUCT.pack(
             TCP_OPT_TIMESTAMP,
             TCP_OPT_TIMESTAMP_LEN,
             self._tsval,
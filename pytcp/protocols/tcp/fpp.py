@@ -52,6 +52,7 @@ from pytcp.protocols.tcp.ps import (
     TCP_OPT_NOP,
     TCP_OPT_NOP_LEN,
     TCP_OPT_SACKPERM,
+    TCP_OPT_SACKPERM_LEN,
     TCP_OPT_TIMESTAMP,
     TCP_OPT_WSCALE,
 )
@@ -59,6 +60,9 @@ from pytcp.protocols.tcp.ps import (
 if TYPE_CHECKING:
     from pytcp.lib.packet import PacketRx
 
+TCP_OPT_MSS_VALUE_STRUCT = struct.Struct("!H")
+TCP_OPT_TIMESTAMP_VALUES_STRUCT = struct.Struct("!LL")
+
 
 class TcpParser:
     """
@@ -156,6 +160,15 @@ class TcpParser:
             self._cache__hlen = (self._frame[12] & 0b11110000) >> 2
         return self._cache__hlen
 
+    @property
+    def flags(self) -> int:
+        """
+        Read the 'CRW' to 'FIN' flags as a single bit field.
+        """
+        if "_cache__flags" not in self.__dict__:
+            self._cache__flags = self._frame[13]
+        return self._cache__flags
+
     @property
     def flag_ns(self) -> bool:
         """
@@ -355,12 +368,19 @@ class TcpParser:
             optr = TCP_HEADER_LEN
             while optr < self.hlen:
                 if self._frame[optr] == TCP_OPT_EOL:
-                    self._cache__options.append(TcpOptEol())
+                    self._cache__options.append(TCP_OPT_EOL_SINGLETON)
                     break
                 if self._frame[optr] == TCP_OPT_NOP:
-                    self._cache__options.append(TcpOptNop())
+                    self._cache__options.append(TCP_OPT_NOP_SINGLETON)
                     optr += TCP_OPT_NOP_LEN
                     continue
+                if (
+                    self._frame[optr] == TCP_OPT_SACKPERM
+                    and self._frame[optr + 1] == TCP_OPT_SACKPERM_LEN
+                ):
+                    self._cache__options.append(TCP_OPT_SACKPERM_SINGLETON)
+                    optr += TCP_OPT_SACKPERM_LEN
+                    continue
                 self._cache__options.append(
                     {
                         TCP_OPT_MSS: TcpOptMss,
@@ -441,7 +461,9 @@ class TcpParser:
         if not config.PACKET_INTEGRITY_CHECK:
             return ""
 
-        if inet_cksum(self._frame[: self._plen], pshdr_sum):
+        if config.PACKET_CHECKSUM_CHECK and inet_cksum(
+            self._frame[: self._plen], pshdr_sum
+        ):
             return "TCP integrity - wrong packet checksum"
 
         if not TCP_HEADER_LEN <= self._plen <= len(self):
@@ -579,7 +601,7 @@ class TcpOptMss:
         """
         self.kind = frame[0]
         self.len = frame[1]
-        self.mss: int = struct.unpack_from("!H", frame, 2)[0]
+        self.mss: int = TCP_OPT_MSS_VALUE_STRUCT.unpack_from(frame, 2)[0]
 
     def __str__(self) -> str:
         """
@@ -650,14 +672,18 @@ class TcpOptTimestamp:
     TCP option - Timestamp (8).
     """
 
+    tsval: int
+    tsecr: int
+
     def __init__(self, frame: bytes) -> None:
         """
         Option constructor.
         """
         self.kind = frame[0]
         self.len = frame[1]
-        self.tsval: int = struct.unpack_from("!L", frame, 2)[0]
-        self.tsecr: int = struct.unpack_from("!L", frame, 6)[0]
+        self.tsval, self.tsecr = TCP_OPT_TIMESTAMP_VALUES_STRUCT.unpack_from(
+            frame, 2
+        )
 
     def __str__(self) -> str:
         """
@@ -693,3 +719,11 @@ class TcpOptUnk:
         Option length.
         """
         return self.len
+
+
+# Stateless options are shared between all parsed packets
+TCP_OPT_EOL_SINGLETON = TcpOptEol()
+TCP_OPT_NOP_SINGLETON = TcpOptNop()
+TCP_OPT_SACKPERM_SINGLETON = TcpOptSackPerm(
+    bytes((TCP_OPT_SACKPERM, TCP_OPT_SACKPERM_LEN))
+)
@@ -40,6 +40,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pytcp.lib.socket_type import SOCK_STREAM, SocketType
+
 if TYPE_CHECKING:
     from pytcp.lib.ip_address import IpAddress
     from pytcp.lib.tracker import Tracker
@@ -50,6 +52,24 @@ class TcpMetadata:
     Store TCP metadata for the RX packet.
     """
 
+    __slots__ = (
+        "local_ip_address",
+        "local_port",
+        "remote_ip_address",
+        "remote_port",
+        "flag_syn",
+        "flag_ack",
+        "flag_fin",
+        "flag_rst",
+        "seq",
+        "ack",
+        "win",
+        "wscale",
+        "mss",
+        "data",
+        "tracker",
+    )
+
     def __init__(
         self,
         local_ip_address: IpAddress,
@@ -98,15 +118,33 @@ class TcpMetadata:
         )
 
     @property
-    def tcp_listening_socket_patterns(self) -> list[str]:
+    def socket_id(self) -> tuple[SocketType, IpAddress, int, IpAddress, int]:
+        """
+        Socket ID that matches active socket.
+        """
+        return (
+            SOCK_STREAM,
+            self.local_ip_address,
+            self.local_port,
+            self.remote_ip_address,
+            self.remote_port,
+        )
+
+    @property
+    def tcp_listening_socket_patterns(
+        self,
+    ) -> list[tuple[SocketType, IpAddress, int, IpAddress, int]]:
         """
         Session ID patterns that match listening socket.
         """
+        unspecified = self.local_ip_address.unspecified
         return [
-            f"AF_INET{self.local_ip_address.version}/SOCK_STREAM/"
-            f"{self.local_ip_address}/{self.local_port}/"
-            f"{self.local_ip_address.unspecified}/0",
-            f"AF_INET{self.local_ip_address.version}/SOCK_STREAM/"
-            f"{self.local_ip_address.unspecified}/{self.local_port}/"
-            f"{self.local_ip_address.unspecified}/0",
+            (
+                SOCK_STREAM,
+                self.local_ip_address,
+                self.local_port,
+                unspecified,
+                0,
+            ),
+            (SOCK_STREAM, unspecified, self.local_port, unspecified, 0),
         ]
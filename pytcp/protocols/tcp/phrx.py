@@ -40,10 +40,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pytcp.lib import stack
-from pytcp.lib.logger import log
+from pytcp.lib.logger import log, log_enabled
 from pytcp.lib.packet import PacketRx
 from pytcp.protocols.tcp.fpp import TcpParser
 from pytcp.protocols.tcp.metadata import TcpMetadata
+from pytcp.protocols.tcp.ps import TCP_FLAG_SYN, TCP_FLAGS_SYN_MASK
 
 if TYPE_CHECKING:
     from pytcp.subsystems.packet_handler import PacketHandler
@@ -60,55 +61,57 @@ def _phrx_tcp(self: PacketHandler, packet_rx: PacketRx) -> None:
 
     if packet_rx.parse_failed:
         self.packet_stats_rx.tcp__failed_parse__drop += 1
-        __debug__ and log(
-            "tcp",
-            f"{packet_rx.tracker} - <CRIT>{packet_rx.parse_failed}</>",
-        )
+        if __debug__ and log_enabled("tcp"):
+            log(
+                "tcp",
+                f"{packet_rx.tracker} - <CRIT>{packet_rx.parse_failed}</>",
+            )
         return
 
-    __debug__ and log("tcp", f"{packet_rx.tracker} - {packet_rx.tcp}")
+    tcp = packet_rx.tcp
+    ip = packet_rx.ip
+
+    if __debug__ and log_enabled("tcp"):
+        log("tcp", f"{packet_rx.tracker} - {tcp}")
 
-    assert isinstance(
-        packet_rx.tcp.data, memoryview
-    )  # memoryview: data type check point
+    assert isinstance(tcp.data, memoryview)  # memoryview: data type check point
 
     # Create TcpMetadata object for further processing by TCP FSM
     packet_rx_md = TcpMetadata(
-        local_ip_address=packet_rx.ip.dst,
-        local_port=packet_rx.tcp.dport,
-        remote_ip_address=packet_rx.ip.src,
-        remote_port=packet_rx.tcp.sport,
-        flag_syn=packet_rx.tcp.flag_syn,
-        flag_ack=packet_rx.tcp.flag_ack,
-        flag_fin=packet_rx.tcp.flag_fin,
-        flag_rst=packet_rx.tcp.flag_rst,
-        seq=packet_rx.tcp.seq,
-        ack=packet_rx.tcp.ack,
-        win=packet_rx.tcp.win,
-        wscale=packet_rx.tcp.wscale,
-        mss=packet_rx.tcp.mss,
-        data=packet_rx.tcp.data,  # memoryview: passing as memoryview for tcp
+        local_ip_address=ip.dst,
+        local_port=tcp.dport,
+        remote_ip_address=ip.src,
+        remote_port=tcp.sport,
+        flag_syn=tcp.flag_syn,
+        flag_ack=tcp.flag_ack,
+        flag_fin=tcp.flag_fin,
+        flag_rst=tcp.flag_rst,
+        seq=tcp.seq,
+        ack=tcp.ack,
+        win=tcp.win,
+        wscale=tcp.wscale,
+        mss=tcp.mss,
+        data=tcp.data,  # memoryview: passing as memoryview for tcp
         # session to consume, no need to convert to
         # bytes here
         tracker=packet_rx.tracker,
     )
 
     # Check if incoming packet matches active TCP socket.
-    if tcp_socket := stack.sockets.get(str(packet_rx_md), None):
+    if tcp_socket := stack.sockets.get(packet_rx_md.socket_id, None):
         self.packet_stats_rx.tcp__socket_match_active__forward_to_socket += 1
-        __debug__ and log(
-            "tcp",
-            f"{packet_rx_md.tracker} - <INFO>TCP packet is part of active "
-            f"socket [{tcp_socket}]</>",
-        )
+        if __debug__ and log_enabled("tcp"):
+            log(
+                "tcp",
+                f"{packet_rx_md.tracker} - <INFO>TCP packet is part of active "
+                f"socket [{tcp_socket}]</>",
+            )
         tcp_socket.process_tcp_packet(packet_rx_md)
         return
 
     # Check if incoming packet is an initial SYN packet and if it matches any
     # listening TCP socket.
-    if all({packet_rx_md.flag_syn}) and not any(
-        {packet_rx_md.flag_ack, packet_rx_md.flag_fin, packet_rx_md.flag_rst}
-    ):
+    if tcp.flags & TCP_FLAGS_SYN_MASK == TCP_FLAG_SYN:
         for (
             tcp_listening_socket_pattern
         ) in packet_rx_md.tcp_listening_socket_patterns:
@@ -118,33 +121,32 @@ def _phrx_tcp(self: PacketHandler, packet_rx: PacketRx) -> None:
                 self.packet_stats_rx.tcp__socket_match_listening__forward_to_socket += (
                     1
                 )
-                __debug__ and log(
-                    "tcp",
-                    f"{packet_rx_md.tracker} - <INFO>TCP packet matches "
-                    f"listening socket [{tcp_socket}]</>",
-                )
+                if __debug__ and log_enabled("tcp"):
+                    log(
+                        "tcp",
+                        f"{packet_rx_md.tracker} - <INFO>TCP packet matches "
+                        f"listening socket [{tcp_socket}]</>",
+                    )
                 tcp_socket.process_tcp_packet(packet_rx_md)
                 return
 
     # In case packet doesn't match any session send RST packet
     # in response to it.
     self.packet_stats_rx.tcp__no_socket_match__respond_rst += 1
-    __debug__ and log(
-        "tcp",
-        f"{packet_rx.tracker} - TCP packet from {packet_rx.ip.src} to "
-        f"closed port {packet_rx.tcp.dport}, responding with TCP RST "
-        "packet",
-    )
+    if __debug__ and log_enabled("tcp"):
+        log(
+            "tcp",
+            f"{packet_rx.tracker} - TCP packet from {ip.src} to "
+            f"closed port {tcp.dport}, responding with TCP RST "
+            "packet",
+        )
     self._phtx_tcp(
-        ip_src=packet_rx.ip.dst,
-        ip_dst=packet_rx.ip.src,
-        tcp_sport=packet_rx.tcp.dport,
-        tcp_dport=packet_rx.tcp.sport,
+        ip_src=ip.dst,
+        ip_dst=ip.src,
+        tcp_sport=tcp.dport,
+        tcp_dport=tcp.sport,
         tcp_seq=0,
-        tcp_ack=packet_rx.tcp.seq
-        + packet_rx.tcp.flag_syn
-        + packet_rx.tcp.flag_fin
-        + len(packet_rx.tcp.data),
+        tcp_ack=tcp.seq + tcp.flag_syn + tcp.flag_fin + len(tcp.data),
         tcp_flag_rst=True,
         tcp_flag_ack=True,
         echo_tracker=packet_rx.tracker,
@@ -53,6 +53,18 @@ from __future__ import annotations
 
 TCP_HEADER_LEN = 20
 
+TCP_FLAG_FIN = 0b00000001
+TCP_FLAG_SYN = 0b00000010
+TCP_FLAG_RST = 0b00000100
+TCP_FLAG_PSH = 0b00001000
+TCP_FLAG_ACK = 0b00010000
+TCP_FLAG_URG = 0b00100000
+TCP_FLAG_ECE = 0b01000000
+TCP_FLAG_CRW = 0b10000000
+
+# Flags that tell initial SYN packet apart from the rest of SYN packets
+TCP_FLAGS_SYN_MASK = TCP_FLAG_SYN | TCP_FLAG_ACK | TCP_FLAG_FIN | TCP_FLAG_RST
+
 
 #
 # TCP options
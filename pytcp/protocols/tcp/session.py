@@ -482,7 +482,7 @@ class TcpSession:
 
         # Unregister session
         if self._state in {FsmState.CLOSED}:
-            stack.sockets.pop(str(self._socket))
+            stack.sockets.pop(self._socket.socket_id)
             __debug__ and log(
                 "tcp-ss", f"[{self}] - Unregister associated socket"
             )
@@ -175,7 +175,9 @@ class UdpParser:
         if not config.PACKET_INTEGRITY_CHECK:
             return ""
 
-        if inet_cksum(self._frame[: self._plen], pshdr_sum):
+        if config.PACKET_CHECKSUM_CHECK and inet_cksum(
+            self._frame[: self._plen], pshdr_sum
+        ):
             return "UDP integrity - wrong packet checksum"
 
         if not UDP_HEADER_LEN <= self._plen <= len(self):
@@ -39,11 +39,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from pytcp.lib.ip4_address import Ip4Address
+from pytcp.lib.socket_type import SOCK_DGRAM, SocketType
 
 if TYPE_CHECKING:
     from pytcp.lib.ip_address import IpAddress
     from pytcp.lib.tracker import Tracker
 
+IP4_UNSPECIFIED = Ip4Address(0)
+IP4_BROADCAST = Ip4Address(0xFFFFFFFF)
+
 
 class UdpMetadata:
     """
@@ -77,27 +81,41 @@ class UdpMetadata:
         )
 
     @property
-    def socket_patterns(self) -> list[str]:
+    def socket_patterns(
+        self,
+    ) -> list[tuple[SocketType, IpAddress, int, IpAddress, int]]:
         """
         Socket ID patterns that match this packet.
         """
 
+        unspecified = self.local_ip_address.unspecified
         patterns = [
-            f"AF_INET{self.local_ip_address.version}/SOCK_DGRAM/"
-            f"{self.local_ip_address}/{self.local_port}/"
-            f"{self.remote_ip_address}/{self.remote_port}",
-            f"AF_INET{self.local_ip_address.version}/SOCK_DGRAM/"
-            f"{self.local_ip_address}/{self.local_port}/"
-            f"{self.local_ip_address.unspecified}/0",
-            f"AF_INET{self.local_ip_address.version}/SOCK_DGRAM/"
-            f"{self.local_ip_address.unspecified}/{self.local_port}/"
-            f"{self.local_ip_address.unspecified}/0",
+            (
+                SOCK_DGRAM,
+                self.local_ip_address,
+                self.local_port,
+                self.remote_ip_address,
+                self.remote_port,
+            ),
+            (
+                SOCK_DGRAM,
+                self.local_ip_address,
+                self.local_port,
+                unspecified,
+                0,
+            ),
+            (SOCK_DGRAM, unspecified, self.local_port, unspecified, 0),
         ]
 
         if isinstance(self.local_ip_address, Ip4Address):
             patterns.append(
-                f"AF_INET4/SOCK_DGRAM/0.0.0.0/{self.local_port}/"
-                f"255.255.255.255/{self.remote_port}"
+                (
+                    SOCK_DGRAM,
+                    IP4_UNSPECIFIED,
+                    self.local_port,
+                    IP4_BROADCAST,
+                    self.remote_port,
+                )
             )  # For DHCPv4 client
 
         return patterns
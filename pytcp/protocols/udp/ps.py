@@ -35,6 +35,8 @@ ver 2.7
 
 from __future__ import annotations
 
+import struct
+
 # UDP packet header (RFC 768)
 
 # +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
@@ -45,3 +47,5 @@ from __future__ import annotations
 
 
 UDP_HEADER_LEN = 8
+
+UDP_PORTS_STRUCT = struct.Struct("!HH")
@@ -160,10 +160,10 @@ class UdpSocket(Socket):
             local_port = self._pick_local_port()
 
         # Assigning local port makes socket "bound"
-        stack.sockets.pop(str(self), None)
+        stack.sockets.pop(self.socket_id, None)
         self._local_ip_address = local_ip_address
         self._local_port = local_port
-        stack.sockets[str(self)] = self
+        stack.sockets[self.socket_id] = self
 
         __debug__ and log("socket", f"<g>[{self}]</> - Bound")
 
@@ -193,12 +193,12 @@ class UdpSocket(Socket):
         )
 
         # Re-register socket with new socket id
-        stack.sockets.pop(str(self), None)
+        stack.sockets.pop(self.socket_id, None)
         self._local_ip_address = local_ip_address
         self._local_port = local_port
         self._remote_ip_address = remote_ip_address
         self._remote_port = remote_port
-        stack.sockets[str(self)] = self
+        stack.sockets[self.socket_id] = self
 
         __debug__ and log("socket", f"<g>[{self}]</> - Connected socket")
 
@@ -257,9 +257,9 @@ class UdpSocket(Socket):
 
         # Assigning local port makes socket "bound" if not "bound" already
         if self._local_port not in range(1, 65536):
-            stack.sockets.pop(str(self), None)
+            stack.sockets.pop(self.socket_id, None)
             self._local_port = self._pick_local_port()
-            stack.sockets[str(self)] = self
+            stack.sockets[self.socket_id] = self
 
         # Set local and remote ip addresses aproprietely
         local_ip_address, remote_ip_address = self._set_ip_addresses(
@@ -331,11 +331,43 @@ class UdpSocket(Socket):
             )
         raise ReceiveTimeout
 
+    def recvfrom_batch(
+        self, max_count: int, timeout: float | None = None
+    ) -> list[tuple[bytes, tuple[str, int]]]:
+        """
+        Read up to 'max_count' datagrams from socket. Blocks only until
+        the first datagram is available, then drains whatever else is
+        already queued.
+        """
+
+        if not self._packet_rx_md_ready.acquire(timeout=timeout):
+            raise ReceiveTimeout
+
+        packets_rx_md = [self._packet_rx_md.pop(0)]
+        while len(packets_rx_md) < max_count:
+            if not self._packet_rx_md_ready.acquire(blocking=False):
+                break
+            packets_rx_md.append(self._packet_rx_md.pop(0))
+
+        __debug__ and log(
+            "socket",
+            f"<g>[{self}]</> - <lg>Received</> {len(packets_rx_md)} "
+            "datagrams",
+        )
+
+        return [
+            (
+                packet_rx_md.data,
+                (str(packet_rx_md.remote_ip_address), packet_rx_md.remote_port),
+            )
+            for packet_rx_md in packets_rx_md
+        ]
+
     def close(self) -> None:
         """
         Close socket.
         """
-        stack.sockets.pop(str(self), None)
+        stack.sockets.pop(self.socket_id, None)
         __debug__ and log("socket", f"<g>[{self}]</> - Closed socket")
 
     def process_udp_packet(self, packet_rx_md: UdpMetadata) -> None:
@@ -45,7 +45,7 @@ from pytcp import config
 from pytcp.lib import stack
 from pytcp.lib.ip4_address import Ip4Address
 from pytcp.lib.logger import log
-from pytcp.lib.mac_address import MacAddress
+from pytcp.lib.mac_address import MAC_BROADCAST, MAC_ZERO, MacAddress
 from pytcp.protocols.arp.ps import ARP_OP_REQUEST
 
 
@@ -180,12 +180,12 @@ class ArpCache:
         """Enqueue ARP request packet with TX ring."""
         stack.packet_handler._phtx_arp(
             ether_src=stack.packet_handler.mac_unicast,
-            ether_dst=MacAddress(0xFFFFFFFFFFFF),
+            ether_dst=MAC_BROADCAST,
             arp_oper=ARP_OP_REQUEST,
             arp_sha=stack.packet_handler.mac_unicast,
             arp_spa=stack.packet_handler.ip4_unicast[0]
             if stack.packet_handler.ip4_unicast
             else Ip4Address(0),
-            arp_tha=MacAddress(0),
+            arp_tha=MAC_ZERO,
             arp_tpa=arp_tpa,
         )
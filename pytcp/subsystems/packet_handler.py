@@ -45,14 +45,21 @@ from __future__ import annotations
 import random
 import threading
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from pytcp import config
 from pytcp.lib import stack
 from pytcp.lib.ip4_address import Ip4Address, Ip4Host
-from pytcp.lib.ip6_address import Ip6Address, Ip6Host, Ip6Network
+from pytcp.lib.ip6_address import (
+    IP6_ALL_NODES,
+    IP6_ALL_ROUTERS,
+    Ip6Address,
+    Ip6Host,
+    Ip6Network,
+)
 from pytcp.lib.logger import log
-from pytcp.lib.mac_address import MacAddress
+from pytcp.lib.mac_address import MAC_BROADCAST, MAC_ZERO, MacAddress
 from pytcp.lib.packet_stats import PacketStatsRx, PacketStatsTx
 from pytcp.protocols.arp.phrx import _phrx_arp
 from pytcp.protocols.arp.phtx import _phtx_arp
@@ -155,14 +162,24 @@ class PacketHandler:
         # one in this case.
         self.mac_unicast: MacAddress = MacAddress(config.MAC_ADDRESS)
         self.mac_multicast: list[MacAddress] = []
-        self.mac_broadcast: MacAddress = MacAddress(0xFFFFFFFFFFFF)
+        self.mac_broadcast: MacAddress = MAC_BROADCAST
         self.ip6_host_candidate: list[Ip6Host] = []
-        self.ip6_host: list[Ip6Host] = []
         self.ip6_multicast: list[Ip6Address] = []
         self.ip4_host_candidate: list[Ip4Host] = []
-        self.ip4_host: list[Ip4Host] = []
         self.ip4_multicast: list[Ip4Address] = []
 
+        # The IP host lists are only replaced as a whole (never mutated in
+        # place), so the address lists derived from them and consulted for
+        # every packet can be rebuilt once in the setters instead of being
+        # recreated on each lookup.
+        self._ip6_host: list[Ip6Host]
+        self._ip6_unicast: list[Ip6Address]
+        self._ip4_host: list[Ip4Host]
+        self._ip4_unicast: list[Ip4Address]
+        self._ip4_broadcast: list[Ip4Address]
+        self.ip6_host = []
+        self.ip4_host = []
+
         # Used for the ARP DAD process
         self.arp_probe_unicast_conflict: set[Ip4Address] = set()
 
@@ -180,8 +197,14 @@ class PacketHandler:
         self.ip6_id: int = 0
 
         # Used to defragment IPv4 and IPv6 packets
-        self.ip4_frag_flows: dict[tuple[Ip4Address, Ip4Address, int], dict] = {}
-        self.ip6_frag_flows: dict[tuple[Ip6Address, Ip6Address, int], dict] = {}
+        self.ip4_frag_flows: OrderedDict[
+            tuple[Ip4Address, Ip4Address, int], dict
+        ] = OrderedDict()
+        self.ip4_frag_flows_last_gc: float = 0.0
+        self.ip6_frag_flows: OrderedDict[
+            tuple[Ip6Address, Ip6Address, int], dict
+        ] = OrderedDict()
+        self.ip6_frag_flows_last_gc: float = 0.0
 
         # Thread control
         self._run_thread: bool = False
@@ -220,7 +243,7 @@ class PacketHandler:
         Assign the IPv6 addresses.
         """
         if config.IP6_SUPPORT:
-            self._assign_ip6_multicast(Ip6Address("ff02::1"))
+            self._assign_ip6_multicast(IP6_ALL_NODES)
             self._create_stack_ip6_addressing()
 
     def assign_ip4_address(self, ip4_host: Ip4Host) -> None:
@@ -299,33 +322,65 @@ class PacketHandler:
         __debug__ and log("stack", "Started packet handler")
 
         while self._run_thread:
-            if (packet_rx := stack.rx_ring.dequeue()) is not None:
+            for packet_rx in stack.rx_ring.dequeue():
                 self._phrx_ether(packet_rx)
 
         __debug__ and log("stack", "Stopped packet handler")
 
+    @property
+    def ip6_host(self) -> list[Ip6Host]:
+        """
+        Getter for the '_ip6_host' attribute.
+        """
+        return self._ip6_host
+
+    @ip6_host.setter
+    def ip6_host(self, ip6_host: list[Ip6Host]) -> None:
+        """
+        Setter for the '_ip6_host' attribute, refreshes the derived
+        IPv6 unicast address list.
+        """
+        self._ip6_host = ip6_host
+        self._ip6_unicast = [_.address for _ in ip6_host]
+
+    @property
+    def ip4_host(self) -> list[Ip4Host]:
+        """
+        Getter for the '_ip4_host' attribute.
+        """
+        return self._ip4_host
+
+    @ip4_host.setter
+    def ip4_host(self, ip4_host: list[Ip4Host]) -> None:
+        """
+        Setter for the '_ip4_host' attribute, refreshes the derived
+        IPv4 unicast and broadcast address lists.
+        """
+        self._ip4_host = ip4_host
+        self._ip4_unicast = [_.address for _ in ip4_host]
+        self._ip4_broadcast = [_.network.broadcast for _ in ip4_host]
+        self._ip4_broadcast.append(Ip4Address(0xFFFFFFFF))
+
     @property
     def ip6_unicast(self) -> list[Ip6Address]:
         """
         Return list of stack's IPv6 unicast addresses.
         """
-        return [_.address for _ in self.ip6_host]
+        return self._ip6_unicast
 
     @property
     def ip4_unicast(self) -> list[Ip4Address]:
         """
         Return list of stack's IPv4 unicast addresses.
         """
-        return [_.address for _ in self.ip4_host]
+        return self._ip4_unicast
 
     @property
     def ip4_broadcast(self) -> list[Ip4Address]:
         """
         Return list of stack's IPv4 broadcast addresses.
         """
-        ip4_broadcast = [_.network.broadcast for _ in self.ip4_host]
-        ip4_broadcast.append(Ip4Address(0xFFFFFFFF))
-        return ip4_broadcast
+        return self._ip4_broadcast
 
     def _perform_ip6_nd_dad(self, ip6_unicast_candidate: Ip6Address) -> bool:
         """
@@ -448,7 +503,7 @@ class PacketHandler:
         for ip4_host in list(self.ip4_host_candidate):
             self.ip4_host_candidate.remove(ip4_host)
             if ip4_host.address not in self.arp_probe_unicast_conflict:
-                self.ip4_host.append(ip4_host)
+                self.ip4_host = [*self.ip4_host, ip4_host]
                 self._send_arp_announcement(ip4_host.address)
                 __debug__ and log(
                     "stack",
@@ -472,11 +527,11 @@ class PacketHandler:
         """
         self._phtx_arp(
             ether_src=self.mac_unicast,
-            ether_dst=MacAddress(0xFFFFFFFFFFFF),
+            ether_dst=MAC_BROADCAST,
             arp_oper=ARP_OP_REQUEST,
             arp_sha=self.mac_unicast,
             arp_spa=Ip4Address(0),
-            arp_tha=MacAddress(0),
+            arp_tha=MAC_ZERO,
             arp_tpa=ip4_unicast,
         )
         __debug__ and log("stack", f"Sent out ARP probe for {ip4_unicast}")
@@ -487,11 +542,11 @@ class PacketHandler:
         """
         self._phtx_arp(
             ether_src=self.mac_unicast,
-            ether_dst=MacAddress(0xFFFFFFFFFFFF),
+            ether_dst=MAC_BROADCAST,
             arp_oper=ARP_OP_REQUEST,
             arp_sha=self.mac_unicast,
             arp_spa=ip4_unicast,
-            arp_tha=MacAddress(0),
+            arp_tha=MAC_ZERO,
             arp_tpa=ip4_unicast,
         )
         __debug__ and log(
@@ -504,11 +559,11 @@ class PacketHandler:
         """
         self._phtx_arp(
             ether_src=self.mac_unicast,
-            ether_dst=MacAddress(0xFFFFFFFFFFFF),
+            ether_dst=MAC_BROADCAST,
             arp_oper=ARP_OP_REPLY,
             arp_sha=self.mac_unicast,
             arp_spa=ip4_unicast,
-            arp_tha=MacAddress(0),
+            arp_tha=MAC_ZERO,
             arp_tpa=ip4_unicast,
         )
         __debug__ and log("stack", f"Sent out Gratitous ARP for {ip4_unicast}")
@@ -526,7 +581,7 @@ class PacketHandler:
                 record_type=ICMP6_MART_CHANGE_TO_EXCLUDE, multicast_address=_
             )
             for _ in self.ip6_multicast
-            if _ not in {Ip6Address("ff02::1")}
+            if _ not in {IP6_ALL_NODES}
         }:
             self._phtx_icmp6(
                 ip6_src=self.ip6_unicast[0]
@@ -569,7 +624,7 @@ class PacketHandler:
         """
         self._phtx_icmp6(
             ip6_src=self.ip6_unicast[0],
-            ip6_dst=Ip6Address("ff02::2"),
+            ip6_dst=IP6_ALL_ROUTERS,
             ip6_hop=255,
             icmp6_type=ICMP6_ND_ROUTER_SOLICITATION,
             icmp6_nd_options=[Icmp6NdOptSLLA(self.mac_unicast)],
@@ -580,7 +635,7 @@ class PacketHandler:
         """
         Assign IPv6 host unicast  address to the list stack listens on.
         """
-        self.ip6_host.append(ip6_host)
+        self.ip6_host = [*self.ip6_host, ip6_host]
         __debug__ and log("stack", f"Assigned IPv6 unicast address {ip6_host}")
         self._assign_ip6_multicast(ip6_host.address.solicited_node_multicast)
 
@@ -588,7 +643,9 @@ class PacketHandler:
         """
         Remove IPv6 host unicast address from the list stack listens on.
         """
-        self.ip6_host.remove(ip6_host)
+        ip6_hosts = list(self.ip6_host)
+        ip6_hosts.remove(ip6_host)
+        self.ip6_host = ip6_hosts
         __debug__ and log("stack", f"Removed IPv6 unicast address {ip6_host}")
         self._remove_ip6_multicast(ip6_host.address.solicited_node_multicast)
 
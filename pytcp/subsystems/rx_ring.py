@@ -41,6 +41,7 @@ import os
 import select
 import threading
 import time
+from collections import deque
 from typing import TYPE_CHECKING
 
 from pytcp.lib.logger import log
@@ -59,7 +60,7 @@ class RxRing:
         """
         Initialize access to tap interface and the inbound queue.
         """
-        self._rx_ring: list[PacketRx] = []
+        self._rx_ring: deque[PacketRx] = deque()
         self._packet_enqueued: Semaphore = threading.Semaphore(0)
         self._run_thread: bool = False
         self._tap: int = -1
@@ -107,13 +108,20 @@ class RxRing:
 
         __debug__ and log("stack", "Stopped RX ring")
 
-    def dequeue(self) -> PacketRx | None:
+    def dequeue(self) -> list[PacketRx]:
         """
-        Dequeue inboutd frame from RX ring.
+        Dequeue all inbound frames currently waiting in RX ring.
         """
 
         # Timeout here is needed so this call doesn't block forever and we are
         # able to exit the thread in packet_handler gracefully.
         self._packet_enqueued.acquire(timeout=0.1)
 
-        return self._rx_ring.pop(0) if self._rx_ring else None
+        if not self._rx_ring:
+            return []
+
+        packets_rx = [self._rx_ring.popleft()]
+        while self._rx_ring and self._packet_enqueued.acquire(blocking=False):
+            packets_rx.append(self._rx_ring.popleft())
+
+        return packets_rx
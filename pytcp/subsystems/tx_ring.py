@@ -92,7 +92,7 @@ class TxRing:
 
         # Using static frame buffer to avoid dynamic memory allocation
         # for each frame.
-        frame_buffer = bytearray(config.TAP_MTU + 14)
+        frame_buffer = memoryview(bytearray(config.TAP_MTU + 14))
 
         while self._run_thread:
             # Timeout here is needed so the call doesn't block forever and
@@ -110,7 +110,7 @@ class TxRing:
                     f"len ({packet_tx_len}) > mtu ({config.TAP_MTU + 14})",
                 )
                 continue
-            frame = memoryview(frame_buffer)[:packet_tx_len]
+            frame = frame_buffer[:packet_tx_len]
             packet_tx.assemble(frame)
             try:
                 os.write(self._tap, frame)
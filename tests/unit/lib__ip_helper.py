@@ -35,7 +35,7 @@ from dataclasses import dataclass
 
 from testslide import TestCase
 
-from pytcp.lib.ip_helper import inet_cksum, ip_version
+from pytcp.lib.ip_helper import inet_cksum, inet_cksum_incr, ip_version
 
 
 class TestIpHelper(TestCase):
@@ -87,6 +87,47 @@ class TestIpHelper(TestCase):
             result = inet_cksum(data=memoryview(sample.data), init=sample.init)
             self.assertEqual(result, sample.result)
 
+    def test_inet_cksum_incr(self) -> None:
+        """
+        Test updating the Internet Checksum after single word change.
+        """
+
+        @dataclass
+        class Sample:
+            data: bytes
+            offset: int
+            new_word: int
+
+        samples = [
+            Sample(
+                b"\x45\x00\x00\x3c\x1c\x46\x40\x00\x40\x06\x00\x00"
+                b"\xac\x10\x0a\x63\xac\x10\x0a\x0c",
+                8,
+                0x3F06,
+            ),
+            Sample(b"\x01\x02\x03\x04" * 375, 100, 0xFFFF),
+            Sample(b"\xFF" * 1500, 0, 0x0000),
+            Sample(b"\x00" * 1500, 1498, 0x1234),
+            Sample(b"\x07" * 9999, 4444, 0xA3DC),
+            Sample(b"\x00" * 18 + b"\x12\x34", 18, 0x0000),
+            Sample(b"\x00" * 18 + b"\xFF\xFF", 18, 0x0000),
+            Sample(b"\x00" * 20, 10, 0xFFFF),
+        ]
+
+        for sample in samples:
+            data = bytearray(sample.data)
+            cksum = inet_cksum(memoryview(data))
+            old_word = int.from_bytes(data[sample.offset : sample.offset + 2])
+            data[sample.offset : sample.offset + 2] = sample.new_word.to_bytes(
+                2
+            )
+            # Results are compared modulo one's complement zero as the
+            # incremental update can't tell +0 and -0 apart
+            self.assertEqual(
+                inet_cksum_incr(cksum, old_word, sample.new_word) % 0xFFFF,
+                inet_cksum(memoryview(data)) % 0xFFFF,
+            )
+
     def test_ip_version(self) -> None:
         """
         Test detecting the version of IP protocol.
@@ -35,7 +35,16 @@ from dataclasses import dataclass
 
 from testslide import TestCase
 
-from pytcp.lib.mac_address import MacAddress, MacIp4AddressFormatError
+from pytcp.lib.mac_address import (
+    MAC_FLAG_BROADCAST,
+    MAC_FLAG_MULTICAST_IP4,
+    MAC_FLAG_MULTICAST_IP6,
+    MAC_FLAG_MULTICAST_IP6_SOLICITED_NODE,
+    MAC_FLAG_UNICAST,
+    MAC_FLAG_UNSPECIFIED,
+    MacAddress,
+    MacIp4AddressFormatError,
+)
 
 
 class TestMacAddress(TestCase):
@@ -79,6 +88,18 @@ class TestMacAddress(TestCase):
             MacAddress("01:23:45:ab:cd:ef")._address,
             1251004370415,
         )
+        self.assertEqual(
+            MacAddress("01-23-45-ab-cd-ef")._address,
+            1251004370415,
+        )
+        self.assertEqual(
+            MacAddress("0123.45ab.cdef")._address,
+            1251004370415,
+        )
+        self.assertEqual(
+            MacAddress("012345abcdef")._address,
+            1251004370415,
+        )
         self.assertEqual(
             MacAddress(MacAddress("01:23:45:ab:cd:ef"))._address,
             1251004370415,
@@ -111,6 +132,16 @@ class TestMacAddress(TestCase):
             MacAddress,
             "01:23:45:ab:cd::eg",
         )
+        self.assertRaises(
+            MacIp4AddressFormatError,
+            MacAddress,
+            "0123.45ab:cdef",
+        )
+        self.assertRaises(
+            MacIp4AddressFormatError,
+            MacAddress,
+            "012345abcdeg",
+        )
         self.assertRaises(
             MacIp4AddressFormatError,
             MacAddress,
@@ -239,3 +270,19 @@ class TestMacAddress(TestCase):
                 sample.mac_address.is_broadcast,
                 sample.is_broadcast,
             )
+
+    def test_classify(self) -> None:
+        """
+        Test the 'classify()' method.
+        """
+        for sample in self.mac_samples:
+            self.assertEqual(
+                sample.mac_address.classify(),
+                MAC_FLAG_UNSPECIFIED * sample.is_unspecified
+                | MAC_FLAG_UNICAST * sample.is_unicast
+                | MAC_FLAG_MULTICAST_IP4 * sample.is_multicast_ip4
+                | MAC_FLAG_MULTICAST_IP6 * sample.is_multicast_ip6
+                | MAC_FLAG_MULTICAST_IP6_SOLICITED_NODE
+                * sample.is_multicast_ip6_solicited_node
+                | MAC_FLAG_BROADCAST * sample.is_broadcast,
+            )
@@ -144,6 +144,7 @@ CONFIG_PATCHES = {
     "IP4_SUPPORT": True,
     "PACKET_INTEGRITY_CHECK": True,
     "PACKET_SANITY_CHECK": True,
+    "PACKET_CHECKSUM_CHECK": True,
     "TAP_MTU": 1500,
     "UDP_ECHO_NATIVE_DISABLE": False,
     "IP4_DEFAULT_TTL": 64,
@@ -1383,10 +1383,30 @@ class TestIcmp6NdOptPI(TestCase):
         )
         self.assertEqual(
             bytes(option),
-            b"\x03\x04@\xc0\x00\xbcaN\x059\x7f\xb1\x00\x00\x00\x00\x00\x01\x00"
+            b"\x03\x04@\xe0\x00\xbcaN\x059\x7f\xb1\x00\x00\x00\x00\x00\x01\x00"
             b"\x02\x00\x03\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00",
         )
 
+    def test_icmp6_fpa_nd_opt_pi__flags(self) -> None:
+        """
+        Test the L, A and R flag bits in both '__bytes__()' and 'assemble()'.
+        """
+        for flags, flags_byte in (
+            ({"flag_l": True}, 0b10000000),
+            ({"flag_a": True}, 0b01000000),
+            ({"flag_r": True}, 0b00100000),
+        ):
+            option = Icmp6NdOptPI(
+                valid_lifetime=12345678,
+                prefer_lifetime=87654321,
+                prefix=Ip6Network("1:2:3:4::/64"),
+                **flags,
+            )
+            frame = memoryview(bytearray(len(option)))
+            option.assemble(frame, 0)
+            self.assertEqual(bytes(option)[3], flags_byte)
+            self.assertEqual(frame[3], flags_byte)
+
     def test_icmp6_fpa_nd_opt_pi____eq__(self) -> None:
         """
         Test the '__eq__()' dunder.
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+
+############################################################################
+#                                                                          #
+#  PyTCP - Python TCP/IP stack                                             #
+#  Copyright (C) 2020-present Sebastian Majewski                           #
+#                                                                          #
+#  This program is free software: you can redistribute it and/or modify    #
+#  it under the terms of the GNU General Public License as published by    #
+#  the Free Software Foundation, either version 3 of the License, or       #
+#  (at your option) any later version.                                     #
+#                                                                          #
+#  This program is distributed in the hope that it will be useful,         #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of          #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           #
+#  GNU General Public License for more details.                            #
+#                                                                          #
+#  You should have received a copy of the GNU General Public License       #
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.  #
+#                                                                          #
+#  Author's email: ccie18643@gmail.com                                     #
+#  Github repository: https://github.com/ccie18643/PyTCP                   #
+#                                                                          #
+############################################################################
+
+#
+# tests/ip4_fpp.py -  tests specific for IPv4 fpp module
+#
+# ver 2.7
+#
+
+
+from testslide import TestCase
+
+from pytcp.lib.packet import PacketRx
+from pytcp.protocols.ip4.fpa import Ip4Assembler
+from pytcp.protocols.ip4.fpp import Ip4Parser
+from pytcp.protocols.raw.fpa import RawAssembler
+from tests.unit.mock_network import MockNetworkSettings
+
+
+class TestIp4Parser(TestCase):
+    """
+    IPv4 packet parser unit test class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setup tests.
+        """
+        super().setUp()
+        self.mns = MockNetworkSettings()
+        self.patch_attribute(
+            "pytcp.protocols.ip4.fpp.config", "PACKET_INTEGRITY_CHECK", True
+        )
+        self.patch_attribute(
+            "pytcp.protocols.ip4.fpp.config", "PACKET_SANITY_CHECK", True
+        )
+
+    def _packet_rx__bad_cksum(self) -> PacketRx:
+        """
+        Create IPv4 packet with corrupted header checksum.
+        """
+        packet = Ip4Assembler(
+            src=self.mns.host_a_ip4_address,
+            dst=self.mns.stack_ip4_host.address,
+            carried_packet=RawAssembler(data=b"X" * 8),
+        )
+        frame = memoryview(bytearray(len(packet)))
+        packet.assemble(frame)
+        frame[10] ^= 0xFF
+        return PacketRx(frame)
+
+    # Test name format: 'test_name__test_description__optional_condition'
+
+    def test_ip4_fpp__checksum__rejected(self) -> None:
+        """
+        Test that packet with bad checksum is rejected by default.
+        """
+        packet_rx = self._packet_rx__bad_cksum()
+        Ip4Parser(packet_rx)
+        self.assertEqual(
+            packet_rx.parse_failed, "IPv4 integriy - wrong packet checksum"
+        )
+
+    def test_ip4_fpp__checksum__accepted__checksum_check_disabled(
+        self,
+    ) -> None:
+        """
+        Test that packet with bad checksum is accepted when the checksum
+        check is disabled.
+        """
+        self.patch_attribute(
+            "pytcp.protocols.ip4.fpp.config", "PACKET_CHECKSUM_CHECK", False
+        )
+        packet_rx = self._packet_rx__bad_cksum()
+        Ip4Parser(packet_rx)
+        self.assertEqual(packet_rx.parse_failed, "")
+        self.assertEqual(packet_rx.ip4.src, self.mns.host_a_ip4_address)
+        self.assertEqual(bytes(packet_rx.frame), b"X" * 8)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+
+############################################################################
+#                                                                          #
+#  PyTCP - Python TCP/IP stack                                             #
+#  Copyright (C) 2020-present Sebastian Majewski                           #
+#                                                                          #
+#  This program is free software: you can redistribute it and/or modify    #
+#  it under the terms of the GNU General Public License as published by    #
+#  the Free Software Foundation, either version 3 of the License, or       #
+#  (at your option) any later version.                                     #
+#                                                                          #
+#  This program is distributed in the hope that it will be useful,         #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of          #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           #
+#  GNU General Public License for more details.                            #
+#                                                                          #
+#  You should have received a copy of the GNU General Public License       #
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.  #
+#                                                                          #
+#  Author's email: ccie18643@gmail.com                                     #
+#  Github repository: https://github.com/ccie18643/PyTCP                   #
+#                                                                          #
+############################################################################
+
+
+#
+# tests/ip4_phrx.py -  tests specific for IPv4 phrx module
+#
+# ver 2.7
+#
+
+
+from testslide import TestCase
+
+from pytcp.lib.packet import PacketRx
+from pytcp.protocols.ip4.fpa import Ip4FragAssembler
+from pytcp.protocols.ip4.fpp import Ip4Parser
+from pytcp.subsystems.packet_handler import PacketHandler
+from tests.unit.mock_network import MockNetworkSettings, patch_config
+
+
+class TestIp4Phrx(TestCase):
+    """
+    IPv4 packet handler RX unit test class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setup tests.
+        """
+        super().setUp()
+        self.mns = MockNetworkSettings()
+        patch_config(self)
+        self.patch_attribute(
+            "pytcp.protocols.ip4.phrx.config", "IP4_FRAG_FLOW_LIMIT", 8
+        )
+        self.patch_attribute(
+            "pytcp.protocols.ip4.phrx.config", "IP4_FRAG_FLOW_FRAG_LIMIT", 4
+        )
+        self.packet_handler = PacketHandler()
+
+    def _fragment(
+        self, id: int, offset: int, data: bytes, last: bool = False
+    ) -> PacketRx:
+        """
+        Create parsed IPv4 fragment.
+        """
+        fragment = Ip4FragAssembler(
+            src=self.mns.host_a_ip4_address,
+            dst=self.mns.stack_ip4_host.address,
+            id=id,
+            flag_mf=not last,
+            offset=offset,
+            data=data,
+        )
+        frame = memoryview(bytearray(len(fragment)))
+        fragment.assemble(frame)
+        packet_rx = PacketRx(frame)
+        Ip4Parser(packet_rx)
+        self.assertEqual(packet_rx.parse_failed, "")
+        return packet_rx
+
+    # Test name format: 'test_name__test_description__optional_condition'
+
+    def test_ip4_phrx__defragment__flow_limit(self) -> None:
+        """
+        Test that flooding fragment flows keeps only the most recently
+        used flows within the configured limit.
+        """
+        for id in range(2000):
+            self.packet_handler._defragment_ip4_packet(
+                self._fragment(id=id, offset=65440, data=b"X" * 8)
+            )
+        self.packet_handler._defragment_ip4_packet(
+            self._fragment(id=1993, offset=0, data=b"X" * 8)
+        )
+        self.packet_handler._defragment_ip4_packet(
+            self._fragment(id=2000, offset=65440, data=b"X" * 8)
+        )
+        self.assertEqual(
+            [_[2] for _ in self.packet_handler.ip4_frag_flows],
+            [1994, 1995, 1996, 1997, 1998, 1999, 1993, 2000],
+        )
+
+    def test_ip4_phrx__defragment__flow_expired(self) -> None:
+        """
+        Test that expired fragment flows are swept.
+        """
+        self.mock_callable(
+            "pytcp.protocols.ip4.phrx", "time"
+        ).to_return_value(1000.0)
+        for id in range(4):
+            self.packet_handler._defragment_ip4_packet(
+                self._fragment(id=id, offset=0, data=b"X" * 8)
+            )
+        self.mock_callable(
+            "pytcp.protocols.ip4.phrx", "time"
+        ).to_return_value(1010.0)
+        self.packet_handler._defragment_ip4_packet(
+            self._fragment(id=4, offset=0, data=b"X" * 8)
+        )
+        self.assertEqual(
+            [_[2] for _ in self.packet_handler.ip4_frag_flows],
+            [4],
+        )
+
+    def test_ip4_phrx__defragment__too_long_drop(self) -> None:
+        """
+        Test that fragments reassembling into packet exceeding the maximum
+        IPv4 packet length are dropped along with their flow.
+        """
+        self.packet_handler._defragment_ip4_packet(
+            self._fragment(id=0, offset=0, data=b"X" * 65488)
+        )
+        self.assertIsNone(
+            self.packet_handler._defragment_ip4_packet(
+                self._fragment(id=0, offset=65488, data=b"X" * 48, last=True)
+            )
+        )
+        self.assertEqual(len(self.packet_handler.ip4_frag_flows), 0)
+
+    def test_ip4_phrx__defragment__duplicates(self) -> None:
+        """
+        Test that duplicate fragments don't grow the per flow state.
+        """
+        for _ in range(100):
+            self.packet_handler._defragment_ip4_packet(
+                self._fragment(id=0, offset=0, data=b"X" * 8)
+            )
+            self.packet_handler._defragment_ip4_packet(
+                self._fragment(id=0, offset=64, data=b"X" * 8, last=True)
+            )
+        flow = next(iter(self.packet_handler.ip4_frag_flows.values()))
+        self.assertEqual(flow["covered"], 8)
+        self.assertEqual(flow["pending"], {64: 72})
+
+    def test_ip4_phrx__defragment__fragment_limit(self) -> None:
+        """
+        Test that flow holding too many out of order fragments is dropped.
+        """
+        for offset in (16, 32, 48, 64):
+            self.packet_handler._defragment_ip4_packet(
+                self._fragment(id=0, offset=offset, data=b"X" * 8)
+            )
+        self.assertEqual(len(self.packet_handler.ip4_frag_flows), 1)
+        self.packet_handler._defragment_ip4_packet(
+            self._fragment(id=0, offset=80, data=b"X" * 8)
+        )
+        self.assertEqual(len(self.packet_handler.ip4_frag_flows), 0)
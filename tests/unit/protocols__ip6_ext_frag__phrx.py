@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+
+
+############################################################################
+#                                                                          #
+#  PyTCP - Python TCP/IP stack                                             #
+#  Copyright (C) 2020-present Sebastian Majewski                           #
+#                                                                          #
+#  This program is free software: you can redistribute it and/or modify    #
+#  it under the terms of the GNU General Public License as published by    #
+#  the Free Software Foundation, either version 3 of the License, or       #
+#  (at your option) any later version.                                     #
+#                                                                          #
+#  This program is distributed in the hope that it will be useful,         #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of          #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           #
+#  GNU General Public License for more details.                            #
+#                                                                          #
+#  You should have received a copy of the GNU General Public License       #
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.  #
+#                                                                          #
+#  Author's email: ccie18643@gmail.com                                     #
+#  Github repository: https://github.com/ccie18643/PyTCP                   #
+#                                                                          #
+############################################################################
+
+
+#
+# tests/ip6_ext_frag_phrx.py -  tests specific for IPv6 fragment phrx module
+#
+# ver 2.7
+#
+
+
+from testslide import TestCase
+
+from pytcp.lib.packet import PacketRx
+from pytcp.protocols.ip6.fpa import Ip6Assembler
+from pytcp.protocols.ip6.fpp import Ip6Parser
+from pytcp.protocols.ip6_ext_frag.fpa import Ip6ExtFragAssembler
+from pytcp.protocols.ip6_ext_frag.fpp import Ip6ExtFragParser
+from pytcp.subsystems.packet_handler import PacketHandler
+from tests.unit.mock_network import MockNetworkSettings, patch_config
+
+
+class TestIp6ExtFragPhrx(TestCase):
+    """
+    IPv6 fragment extension header packet handler RX unit test class.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setup tests.
+        """
+        super().setUp()
+        self.mns = MockNetworkSettings()
+        patch_config(self)
+        self.patch_attribute(
+            "pytcp.protocols.ip6_ext_frag.phrx.config",
+            "IP6_FRAG_FLOW_LIMIT",
+            8,
+        )
+        self.patch_attribute(
+            "pytcp.protocols.ip6_ext_frag.phrx.config",
+            "IP6_FRAG_FLOW_FRAG_LIMIT",
+            4,
+        )
+        self.packet_handler = PacketHandler()
+
+    def _fragment(
+        self, id: int, offset: int, data: bytes, last: bool = False
+    ) -> PacketRx:
+        """
+        Create parsed IPv6 fragment.
+        """
+        packet = Ip6Assembler(
+            src=self.mns.host_a_ip6_address,
+            dst=self.mns.stack_ip6_host.address,
+            carried_packet=Ip6ExtFragAssembler(
+                next=17,
+                offset=offset,
+                flag_mf=not last,
+                id=id,
+                data=data,
+            ),
+        )
+        frame = memoryview(bytearray(len(packet)))
+        packet.assemble(frame)
+        packet_rx = PacketRx(frame)
+        Ip6Parser(packet_rx)
+        Ip6ExtFragParser(packet_rx)
+        self.assertEqual(packet_rx.parse_failed, "")
+        return packet_rx
+
+    # Test name format: 'test_name__test_description__optional_condition'
+
+    def test_ip6_ext_frag_phrx__defragment__out_of_order(self) -> None:
+        """
+        Test reassembling fragments received out of order.
+        """
+        for offset in (24, 8, 16):
+            self.assertIsNone(
+                self.packet_handler._defragment_ip6_packet(
+                    self._fragment(
+                        id=0,
+                        offset=offset,
+                        data=bytes([offset]) * 8,
+                        last=offset == 24,
+                    )
+                )
+            )
+        packet_rx = self.packet_handler._defragment_ip6_packet(
+            self._fragment(id=0, offset=0, data=b"\x00" * 8)
+        )
+        assert packet_rx is not None
+        Ip6Parser(packet_rx)
+        self.assertEqual(packet_rx.parse_failed, "")
+        self.assertEqual(packet_rx.ip6.dlen, 32)
+        self.assertEqual(packet_rx.ip6.next, 17)
+        self.assertEqual(
+            bytes(packet_rx.frame),
+            b"\x00" * 8 + b"\x08" * 8 + b"\x10" * 8 + b"\x18" * 8,
+        )
+        self.assertEqual(len(self.packet_handler.ip6_frag_flows), 0)
+
+    def test_ip6_ext_frag_phrx__defragment__duplicates(self) -> None:
+        """
+        Test that duplicate fragments don't grow the per flow state.
+        """
+        for _ in range(100):
+            self.packet_handler._defragment_ip6_packet(
+                self._fragment(id=0, offset=0, data=b"X" * 8)
+            )
+            self.packet_handler._defragment_ip6_packet(
+                self._fragment(id=0, offset=64, data=b"X" * 8, last=True)
+            )
+        flow = next(iter(self.packet_handler.ip6_frag_flows.values()))
+        self.assertEqual(flow["covered"], 8)
+        self.assertEqual(flow["pending"], {64: 72})
+
+    def test_ip6_ext_frag_phrx__defragment__fragment_limit(self) -> None:
+        """
+        Test that flow holding too many out of order fragments is dropped.
+        """
+        for offset in (16, 32, 48, 64):
+            self.packet_handler._defragment_ip6_packet(
+                self._fragment(id=0, offset=offset, data=b"X" * 8)
+            )
+        self.assertEqual(len(self.packet_handler.ip6_frag_flows), 1)
+        self.packet_handler._defragment_ip6_packet(
+            self._fragment(id=0, offset=80, data=b"X" * 8)
+        )
+        self.assertEqual(len(self.packet_handler.ip6_frag_flows), 0)
+
+    def test_ip6_ext_frag_phrx__defragment__flow_limit(self) -> None:
+        """
+        Test that flooding fragment flows keeps only the most recently
+        used flows within the configured limit.
+        """
+        for id in range(2000):
+            self.packet_handler._defragment_ip6_packet(
+                self._fragment(id=id, offset=64, data=b"X" * 8)
+            )
+        self.packet_handler._defragment_ip6_packet(
+            self._fragment(id=1993, offset=0, data=b"X" * 8)
+        )
+        self.packet_handler._defragment_ip6_packet(
+            self._fragment(id=2000, offset=64, data=b"X" * 8)
+        )
+        self.assertEqual(
+            [_[2] for _ in self.packet_handler.ip6_frag_flows],
+            [1994, 1995, 1996, 1997, 1998, 1999, 1993, 2000],
+        )
+
+    def test_ip6_ext_frag_phrx__defragment__flow_expired(self) -> None:
+        """
+        Test that expired fragment flows are swept.
+        """
+        self.mock_callable(
+            "pytcp.protocols.ip6_ext_frag.phrx", "time"
+        ).to_return_value(1000.0)
+        for id in range(4):
+            self.packet_handler._defragment_ip6_packet(
+                self._fragment(id=id, offset=0, data=b"X" * 8)
+            )
+        self.mock_callable(
+            "pytcp.protocols.ip6_ext_frag.phrx", "time"
+        ).to_return_value(1010.0)
+        self.packet_handler._defragment_ip6_packet(
+            self._fragment(id=4, offset=0, data=b"X" * 8)
+        )
+        self.assertEqual(
+            [_[2] for _ in self.packet_handler.ip6_frag_flows],
+            [4],
+        )
+
+    def test_ip6_ext_frag_phrx__defragment__sweep_interval(self) -> None:
+        """
+        Test that expired fragment flows are swept at most once per second.
+        """
+        for id, now in enumerate((1000.0, 1000.5, 1005.2, 1006.0, 1006.3)):
+            self.mock_callable(
+                "pytcp.protocols.ip6_ext_frag.phrx", "time"
+            ).to_return_value(now)
+            self.packet_handler._defragment_ip6_packet(
+                self._fragment(id=id, offset=0, data=b"X" * 8)
+            )
+            if now == 1006.0:
+                # Flow 1 has expired but the last sweep ran 0.8s ago
+                self.assertEqual(
+                    [_[2] for _ in self.packet_handler.ip6_frag_flows],
+                    [1, 2, 3],
+                )
+        self.assertEqual(
+            [_[2] for _ in self.packet_handler.ip6_frag_flows],
+            [2, 3, 4],
+        )